@@ -18,7 +18,7 @@
 #   - Pure mathematical mapping
 # =============================================================================
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 import yaml
 
@@ -47,6 +47,7 @@ class EHM:
 
         self.config = self._load_config(config_path)
         self.chemicals = self._build_chemical_registry()
+        self._dose_plan = self._build_dose_plan()
 
         print(f"[EHM] Loaded {len(self.chemicals)} chemicals")
         print(f"[EHM] Available stimuli: {len(self.config.get('STIMULUS_KEYS', []))}")
@@ -83,6 +84,31 @@ class EHM:
 
         return registry
 
+    def _build_dose_plan(self) -> Tuple[List[str], List[float], List[float], Dict[str, List[Tuple[int, float, float]]]]:
+        """
+        Precompute the registry in stimulus-major form for map()
+
+        Returns:
+            (chemical names, baselines, max values,
+             stimulus key → [(chemical index, weight, max rate), ...])
+            Zero weights are left out, as _compute_dose skips them.
+        """
+        names, baselines, max_values = [], [], []
+        by_stimulus: Dict[str, List[Tuple[int, float, float]]] = {}
+
+        for index, (chem_name, chem_config) in enumerate(self.chemicals.items()):
+            names.append(chem_name)
+            baselines.append(chem_config.get("baseline", 0.0))
+            max_values.append(chem_config.get("max_value_pg", float('inf')))
+
+            max_rate = chem_config.get("max_rate_pg_per_min", 1.0)
+            for stim_key, weight in chem_config.get("stimulus_weights", {}).items():
+                if weight == 0.0:
+                    continue
+                by_stimulus.setdefault(stim_key, []).append((index, weight, max_rate))
+
+        return names, baselines, max_values, by_stimulus
+
     # -------------------------------------------------------------------------
     # Stimulus → Dose Mapping
     # -------------------------------------------------------------------------
@@ -100,13 +126,53 @@ class EHM:
                 Example: {"AD": 64.0, "CT": 16.8, "DA": 45.0, ...}
         """
 
-        D_Total_H = {}
+        # Same sums as _compute_dose per chemical (same order, so the same
+        # floats), but only the (chemical, weight) pairs each stimulus
+        # actually touches are visited
+        names, baselines, max_values, by_stimulus = self._dose_plan
 
-        for chem_name, chem_config in self.chemicals.items():
-            dose = self._compute_dose(chem_name, chem_config, stimulus_vector)
-            D_Total_H[chem_name] = dose
+        doses = list(baselines)
+        for stim_key, stim_intensity in stimulus_vector.items():
+            for index, weight, max_rate in by_stimulus.get(stim_key, ()):
+                doses[index] += stim_intensity * weight * max_rate
+
+        # clamp(dose, 0.0, max_value), inlined
+        return {
+            chem_name: max(0.0, min(max_value, dose))
+            for chem_name, dose, max_value in zip(names, doses, max_values)
+        }
+
+    def map_batch(self, stimuli: List[Dict[str, float]]) -> List[Dict[str, float]]:
+        """
+        Convert a sequence of stimulus vectors to hormone doses
+
+        EHM keeps no state between ticks, so the whole sequence is mapped in
+        one call with the dose plan unpacked once; each result is the same
+        as map() on that stimulus vector.
 
-        return D_Total_H
+        Args:
+            stimuli: Stimulus vectors, one per tick
+
+        Returns:
+            One D_Total_H dict per stimulus vector, in input order
+        """
+        names, baselines, max_values, by_stimulus = self._dose_plan
+        get_entries = by_stimulus.get
+
+        batch = []
+        append = batch.append
+        for stimulus_vector in stimuli:
+            doses = list(baselines)
+            for stim_key, stim_intensity in stimulus_vector.items():
+                for index, weight, max_rate in get_entries(stim_key, ()):
+                    doses[index] += stim_intensity * weight * max_rate
+
+            append({
+                chem_name: max(0.0, min(max_value, dose))
+                for chem_name, dose, max_value in zip(names, doses, max_values)
+            })
+
+        return batch
 
     def _compute_dose(
         self,
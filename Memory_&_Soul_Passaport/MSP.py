@@ -16,7 +16,7 @@
 # =============================================================================
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, Iterable
 import json
 import time
 import uuid
@@ -28,6 +28,7 @@ try:
     from validation.episodic_validator import EpisodicValidator
     from validation.semantic_validator import SemanticValidator
     from validation.sensory_validator import SensoryValidator
+    from validation.base_validator import release_result
     from validation.confidence_updater import ConfidenceUpdater, UpdateSignal, StakesLevel, get_stakes_level_from_topic
     from validation.exceptions import MSPValidationError, StructuralValidationError
     VALIDATION_AVAILABLE = True
@@ -93,6 +94,33 @@ def save_json(path: Path, data: Dict[str, Any]):
     temp_path.replace(path)
 
 
+def iter_ndjson(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield records from an NDJSON file (one JSON object per line)"""
+    if not path.exists():
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"[Warning] Invalid JSON in {path} line {line_no}: {e}")
+
+
+def append_ndjson(path: Path, records: Iterable[Dict[str, Any]]) -> int:
+    """Append records to an NDJSON file, return number written"""
+    ensure_dir(path.parent)
+    count = 0
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
 # -----------------------------------------------------------------------------
 # MSP — Memory & Soul Passport
 # -----------------------------------------------------------------------------
@@ -119,6 +147,10 @@ class MSP:
         self.user_block_dir = base_path / "07_User_block"
         self.buffer_dir = base_path / "Buffer"
 
+        # Sensory master is split: small header + append-only entries log
+        self.sensory_header_path = self.sensory_dir / "Sensory_memory.header.json"
+        self.sensory_entries_path = self.sensory_dir / "Sensory_memory.entries.ndjson"
+
         # Current context
         self.origin_name: Optional[str] = None
         self.instance_id: Optional[str] = None
@@ -199,7 +231,6 @@ class MSP:
         # Load all memory types
         episodic_path = self.episodic_dir / "Episodic_memory.json"
         semantic_path = self.semantic_dir / "Semantic_memory.json"
-        sensory_path = self.sensory_dir / "Sensory_memory.json"
         user_block_path = self.user_block_dir / "User_Block.json"
 
         self.master_state = {
@@ -208,7 +239,7 @@ class MSP:
             "timestamp": now_iso(),
             "episodic_memory": load_json(episodic_path),
             "semantic_memory": load_json(semantic_path),
-            "sensory_memory": load_json(sensory_path),
+            "sensory_memory": self.load_sensory_master(),
             "user_block": load_json(user_block_path),
             "session_count": self._count_sessions(),
             "core_count": self._count_cores(),
@@ -222,6 +253,45 @@ class MSP:
 
         return self.master_state
 
+    def load_sensory_master(self) -> Dict[str, Any]:
+        """
+        Load sensory master (header + entries log) as one dictionary
+
+        Returns:
+            Header fields with "entries" list, or empty dict if none
+        """
+        self._migrate_sensory_master()
+
+        header = load_json(self.sensory_header_path)
+        if not header and not self.sensory_entries_path.exists():
+            return {}
+
+        header["entries"] = list(iter_ndjson(self.sensory_entries_path))
+        return header
+
+    def _migrate_sensory_master(self):
+        """Split a legacy Sensory_memory.json into header + entries log (once)"""
+        legacy_path = self.sensory_dir / "Sensory_memory.json"
+        if not legacy_path.exists() or self.sensory_header_path.exists():
+            return
+
+        legacy_data = load_json(legacy_path)
+        entries = legacy_data.pop("entries", [])
+        header = {"system": "EVA", "timestamp": now_iso()}
+        header.update(legacy_data)
+        header["entries_file"] = self.sensory_entries_path.name
+
+        # Write the entries log first so a crash never leaves a header without it
+        temp_entries = self.sensory_entries_path.with_suffix('.tmp')
+        if temp_entries.exists():
+            temp_entries.unlink()
+        append_ndjson(temp_entries, entries)
+        temp_entries.replace(self.sensory_entries_path)
+
+        save_json(self.sensory_header_path, header)
+        legacy_path.unlink()
+        print(f"[MSP] Migrated sensory master to NDJSON ({len(entries)} entries)")
+
     def _get_current_version(self) -> int:
         """Get current version number from version file"""
         version_file = self.base_path / "version.json"
@@ -757,7 +827,7 @@ class MSP:
         master_files = [
             self.episodic_dir / "Episodic_memory.json",
             self.semantic_dir / "Semantic_memory.json",
-            self.sensory_dir / "Sensory_memory.json"
+            self.sensory_header_path
         ]
 
         for f in master_files:
@@ -773,6 +843,19 @@ class MSP:
             if f.name == "Semantic_memory.json" and "entries" not in data:
                  raise MSPConsolidationError(f"Verification failed: Semantic memory missing 'entries' key.")
 
+        # Sensory entries log: every line must parse
+        if self.sensory_entries_path.exists():
+            with open(self.sensory_entries_path, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        json.loads(line)
+                    except json.JSONDecodeError:
+                        raise MSPConsolidationError(
+                            f"Verification failed: {self.sensory_entries_path.name} line {line_no} is invalid."
+                        )
+
     def _merge_episodic(self, buffer_data: Dict[str, Any]):
         """Merge episodic buffer into master (append-only)"""
         master_path = self.episodic_dir / "Episodic_memory.json"
@@ -847,12 +930,17 @@ class MSP:
         print(f"      Merged {len(new_entries)} semantic entries (skipped {skipped_count})")
 
     def _merge_sensory(self, buffer_data: Dict[str, Any]):
-        """Merge sensory buffer into master with validation"""
-        master_path = self.sensory_dir / "Sensory_memory.json"
-        master_data = load_json(master_path)
+        """Merge sensory buffer into master with validation (append-only)"""
+        self._migrate_sensory_master()
 
-        if "entries" not in master_data:
-            master_data = {"entries": []}
+        # Header is only written when missing; entries are appended, so
+        # unchanged master entries are never re-serialized
+        if not self.sensory_header_path.exists():
+            save_json(self.sensory_header_path, {
+                "system": "EVA",
+                "timestamp": now_iso(),
+                "entries_file": self.sensory_entries_path.name
+            })
 
         # Validate sensory entries before merging
         new_entries = []
@@ -868,6 +956,7 @@ class MSP:
                     else:
                         skipped_count += 1
                         print(f"      Skipped sensory entry '{entry.get('sensory_id')}': {result.errors}")
+                    release_result(result)
                 except Exception as e:
                     print(f"      Warning: Sensory validation failed: {e}")
                     skipped_count += 1
@@ -875,9 +964,7 @@ class MSP:
                 # No validator: accept all
                 new_entries.append(entry)
 
-        master_data["entries"].extend(new_entries)
-
-        save_json(master_path, master_data)
+        append_ndjson(self.sensory_entries_path, new_entries)
         print(f"      Merged {len(new_entries)} sensory entries (skipped {skipped_count})")
 
     def delete_buffer(self):
@@ -3,7 +3,7 @@
 # Comprehensive validation layer for Memory & Soul Passport
 # =============================================================================
 
-from .base_validator import BaseValidator, ValidationResult
+from .base_validator import BaseValidator, ValidationResult, acquire_result, release_result
 from .schema_validator import SchemaValidator
 from .episodic_validator import EpisodicValidator
 from .semantic_validator import SemanticValidator
@@ -14,8 +14,10 @@ from .confidence_updater import (
     ResolutionState,
     EpistemicStatus,
     StakesLevel,
+    build_conflict_index,
     detect_conflict,
     get_stakes_level_from_topic,
+    normalize_signal_history,
 )
 from .exceptions import (
     MSPValidationError,
@@ -40,6 +42,8 @@ __all__ = [
     # Base classes
     "BaseValidator",
     "ValidationResult",
+    "acquire_result",
+    "release_result",
     "SchemaValidator",
     "EpisodicValidator",
     "SemanticValidator",
@@ -51,8 +55,10 @@ __all__ = [
     "ResolutionState",
     "EpistemicStatus",
     "StakesLevel",
+    "build_conflict_index",
     "detect_conflict",
     "get_stakes_level_from_topic",
+    "normalize_signal_history",
 
     # Exceptions
     "MSPValidationError",
@@ -4,12 +4,19 @@
 # =============================================================================
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AbstractSet, Callable, Collection, Iterable, Union
 from pathlib import Path
 import logging
+import re
+import threading
 from datetime import datetime, timezone
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .exceptions import MSPValidationError
 
 
@@ -17,15 +24,47 @@ from .exceptions import MSPValidationError
 # ValidationResult
 # =============================================================================
 
-@dataclass
 class ValidationResult:
     """Result of validation operation"""
 
-    valid: bool
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-    info: List[str] = field(default_factory=list)
-    context: Dict[str, Any] = field(default_factory=dict)
+    # context is allocated on first access (most results never use it)
+    __slots__ = ("valid", "errors", "warnings", "info", "_ctx")
+
+    def __init__(
+        self,
+        valid: bool,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None,
+        info: Optional[List[str]] = None,
+        context: Optional[Dict[str, Any]] = None
+    ):
+        self.valid = valid
+        self.errors: List[str] = errors if errors is not None else []
+        self.warnings: List[str] = warnings if warnings is not None else []
+        self.info: List[str] = info if info is not None else []
+        self._ctx: Optional[Dict[str, Any]] = context
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Extra result data (e.g. conflict details), created on demand"""
+        ctx = self._ctx
+        if ctx is None:
+            ctx = self._ctx = {}
+        return ctx
+
+    @context.setter
+    def context(self, value: Dict[str, Any]):
+        self._ctx = value
+
+    def reset(self) -> 'ValidationResult':
+        """Clear all messages in place so the instance can be reused"""
+        self.valid = True
+        self.errors.clear()
+        self.warnings.clear()
+        self.info.clear()
+        if self._ctx:
+            self._ctx.clear()
+        return self
 
     def add_error(self, message: str):
         """Add an error (makes result invalid)"""
@@ -46,7 +85,8 @@ class ValidationResult:
         self.errors.extend(other.errors)
         self.warnings.extend(other.warnings)
         self.info.extend(other.info)
-        self.context.update(other.context)
+        if other._ctx:
+            self.context.update(other._ctx)
 
     def __str__(self):
         parts = []
@@ -69,6 +109,81 @@ class ValidationResult:
 
         return "\n".join(parts)
 
+    def __repr__(self):
+        return (
+            f"ValidationResult(valid={self.valid!r}, errors={self.errors!r}, "
+            f"warnings={self.warnings!r}, info={self.info!r}, context={self._ctx or {}!r})"
+        )
+
+
+# =============================================================================
+# ValidationResult Pool
+# =============================================================================
+
+# Bulk validation (e.g. consolidation) allocates one result per entry; recycle
+# them per thread instead of building fresh lists/dicts every call.
+_POOL_MAX_SIZE = 256
+_pool_local = threading.local()
+
+
+def _get_pool() -> List[ValidationResult]:
+    pool = getattr(_pool_local, "pool", None)
+    if pool is None:
+        pool = _pool_local.pool = []
+    return pool
+
+
+def acquire_result(valid: bool = True) -> ValidationResult:
+    """
+    Get a ValidationResult from the thread-local pool (or a new one)
+
+    Args:
+        valid: Initial validity
+
+    Returns:
+        Empty ValidationResult
+    """
+    pool = _get_pool()
+    if pool:
+        result = pool.pop().reset()
+        result.valid = valid
+        return result
+    return ValidationResult(valid=valid)
+
+
+def release_result(result: ValidationResult):
+    """
+    Return a ValidationResult to the thread-local pool
+
+    The caller must not use the result (or its lists) after releasing it.
+
+    Args:
+        result: ValidationResult that is no longer referenced
+    """
+    pool = _get_pool()
+    if len(pool) < _POOL_MAX_SIZE:
+        pool.append(result)
+
+
+# =============================================================================
+# Forbidden Key Prefilter
+# =============================================================================
+
+# Compact orjson output writes every key as "name": so one bytes regex over
+# the serialized blob finds forbidden keys in C. It can report false
+# positives (never false negatives), so it only decides whether the exact
+# path-reporting scan has to run at all.
+_FORBIDDEN_KEY_PATTERNS: Dict[AbstractSet[str], Any] = {}
+
+
+def _forbidden_key_pattern(forbidden_fields: AbstractSet[str]):
+    pattern = _FORBIDDEN_KEY_PATTERNS.get(forbidden_fields)
+    if pattern is None:
+        alternation = b"|".join(re.escape(field.encode()) for field in sorted(forbidden_fields))
+        pattern = re.compile(b'"(?:' + alternation + b')":')
+        _FORBIDDEN_KEY_PATTERNS[forbidden_fields] = pattern
+    return pattern
+
 
 # =============================================================================
 # BaseValidator
@@ -80,7 +195,8 @@ class BaseValidator(ABC):
     def __init__(
         self,
         strict_mode: bool = True,
-        audit_log_path: Optional[Path] = None
+        audit_log_path: Optional[Path] = None,
+        fast_forbidden_scan: bool = False
     ):
         """
         Initialize base validator
@@ -88,9 +204,16 @@ class BaseValidator(ABC):
         Args:
             strict_mode: If True, treat warnings as errors
             audit_log_path: Path to audit log file (optional)
+            fast_forbidden_scan: Prefilter forbidden-field scans with an
+                orjson + regex pass (ignored if orjson is not installed)
         """
         self.strict_mode = strict_mode
         self.audit_log_path = audit_log_path
+        self.fast_forbidden_scan = fast_forbidden_scan and ORJSON_AVAILABLE
+
+        # Per-phase progress lines ("Phase N: ...") only go into results
+        # when an audit log is kept; nothing else reads them
+        self._info_enabled = audit_log_path is not None
 
         # Set up logging
         self.logger = self._setup_logger()
@@ -136,13 +259,17 @@ class BaseValidator(ABC):
         pass
 
     def _create_result(self, valid: bool = True) -> ValidationResult:
-        """Create a new ValidationResult"""
-        return ValidationResult(valid=valid)
+        """Create a new ValidationResult (recycled from the pool when possible)"""
+        return acquire_result(valid)
+
+    def _release_result(self, result: ValidationResult):
+        """Return an internally consumed ValidationResult to the pool"""
+        release_result(result)
 
     def _check_required_fields(
         self,
         data: Dict[str, Any],
-        required_fields: List[str],
+        required_fields: Iterable[str],
         result: ValidationResult,
         path: str = ""
     ):
@@ -151,7 +278,7 @@ class BaseValidator(ABC):
 
         Args:
             data: Data dictionary to check
-            required_fields: List of required field names
+            required_fields: Required field names (errors follow this order)
             result: ValidationResult to update
             path: Current path in nested structure (for error messages)
         """
@@ -164,7 +291,7 @@ class BaseValidator(ABC):
     def _check_enum_value(
         self,
         value: Any,
-        valid_values: List[Any],
+        valid_values: Collection[Any],
         field_name: str,
         result: ValidationResult
     ):
@@ -173,14 +300,24 @@ class BaseValidator(ABC):
 
         Args:
             value: Value to check
-            valid_values: List of valid enum values
+            valid_values: Valid enum values (pass a frozenset for O(1) lookup)
             field_name: Name of field (for error message)
             result: ValidationResult to update
         """
-        if value not in valid_values:
-            result.add_error(
-                f"Invalid enum value for '{field_name}': '{value}' not in {valid_values}"
-            )
+        # noinline: hot episodic paths (generated section checks, turns)
+        # inline this test; keep the message format in sync with them
+        try:
+            if value in valid_values:
+                return
+        except TypeError:
+            # Unhashable value (e.g. a dict) checked against a set
+            pass
+
+        if isinstance(valid_values, AbstractSet):
+            valid_values = sorted(valid_values, key=str)
+        result.add_error(
+            f"Invalid enum value for '{field_name}': '{value}' not in {valid_values}"
+        )
 
     def _check_range(
         self,
@@ -209,54 +346,176 @@ class BaseValidator(ABC):
                 f"Field '{field_name}' value {value} out of range [{min_val}, {max_val}]"
             )
 
+    def _schema_enforces(
+        self,
+        schema: Dict[str, Any],
+        required_fields: Dict[str, Iterable[str]],
+        enum_fields: Dict[str, AbstractSet[Any]]
+    ) -> bool:
+        """
+        Check that a JSON schema rejects whatever the structural checks would
+
+        Args:
+            schema: JSON schema dictionary
+            required_fields: Dotted object path ("" for the root) -> field
+                names that must be required there (the object type is checked too)
+            enum_fields: Dotted field path -> allowed values (the schema
+                enum must be a subset)
+
+        Returns:
+            True if data passing the schema also passes those checks
+        """
+        def node_at(path: str) -> Optional[Dict[str, Any]]:
+            node = schema
+            for name in path.split(".") if path else ():
+                node = node.get("properties", {}).get(name) if isinstance(node, dict) else None
+            return node if isinstance(node, dict) else None
+
+        for path, names in required_fields.items():
+            node = node_at(path)
+            if node is None or node.get("type") != "object":
+                return False
+            if not set(names) <= set(node.get("required", ())):
+                return False
+
+        for path, allowed in enum_fields.items():
+            node = node_at(path)
+            if node is None or not isinstance(node.get("enum"), list):
+                return False
+            try:
+                if not all(value in allowed for value in node["enum"]):
+                    return False
+            except TypeError:
+                return False
+
+        return True
+
     def _scan_for_forbidden_fields(
         self,
         data: Dict[str, Any],
-        forbidden_fields: List[str],
+        forbidden_fields: AbstractSet[str],
         result: ValidationResult,
         path: str = ""
     ):
         """
-        Recursively scan for forbidden fields
+        Scan nested dicts (and dicts inside lists) for forbidden fields
+
+        Uses an explicit stack instead of recursion.
 
         Args:
             data: Data dictionary to scan
-            forbidden_fields: List of forbidden field names
+            forbidden_fields: Forbidden field names (lists are coerced once)
             result: ValidationResult to update
             path: Current path in nested structure
         """
         if not isinstance(data, dict):
             return
 
-        for key, value in data.items():
-            current_path = f"{path}.{key}" if path else key
+        if not isinstance(forbidden_fields, AbstractSet):
+            forbidden_fields = frozenset(forbidden_fields)
 
-            # Check if this key is forbidden
-            if key in forbidden_fields:
-                result.add_error(f"Forbidden field found: '{current_path}'")
+        if self.fast_forbidden_scan and not self._may_contain_forbidden(data, forbidden_fields):
+            return
 
-            # Recurse into nested structures
-            if isinstance(value, dict):
-                self._scan_for_forbidden_fields(value, forbidden_fields, result, current_path)
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    if isinstance(item, dict):
-                        self._scan_for_forbidden_fields(
-                            item, forbidden_fields, result, f"{current_path}[{i}]"
-                        )
+        stack = [(data, path)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node, node_path = pop()
+            for key, value in node.items():
+                # Paths are only formatted for hits and containers; most
+                # keys are scalar leaves that need neither
+                is_forbidden = key in forbidden_fields
+                is_container = isinstance(value, (dict, list))
+                if not (is_forbidden or is_container):
+                    continue
+                current_path = f"{node_path}.{key}" if node_path else key
+
+                # Check if this key is forbidden
+                if is_forbidden:
+                    result.add_error(f"Forbidden field found: '{current_path}'")
+
+                # Queue nested structures
+                if isinstance(value, dict):
+                    push((value, current_path))
+                elif is_container:
+                    for i, item in enumerate(value):
+                        if isinstance(item, dict):
+                            push((item, f"{current_path}[{i}]"))
+
+    def _may_contain_forbidden(self, data: Any, forbidden_fields: AbstractSet[str]) -> bool:
+        """
+        Fast check whether data could contain a forbidden key
+
+        Args:
+            data: Data to check
+            forbidden_fields: Forbidden field names (hashable set)
+
+        Returns:
+            False only if no forbidden key can be present; True if the
+            blob matched or data cannot be serialized by orjson
+        """
+        if not forbidden_fields:
+            return False
+        try:
+            blob = orjson.dumps(data)
+        except TypeError:
+            # orjson.JSONEncodeError (non-str keys, unsupported types)
+            return True
+        return _forbidden_key_pattern(frozenset(forbidden_fields)).search(blob) is not None
+
+    def _audit_enabled(self, levelno: int) -> bool:
+        """
+        Check whether a record at levelno would reach any handler
 
-    def _audit_log(self, level: str, message: str, context: Dict[str, Any] = None):
+        Mirrors logging.Logger.callHandlers so callers can skip building
+        messages that every handler would drop (e.g. INFO in strict mode).
+        """
+        logger = self.logger
+        if not logger.isEnabledFor(levelno):
+            return False
+
+        found = False
+        current = logger
+        while current:
+            for handler in current.handlers:
+                found = True
+                if levelno >= handler.level:
+                    return True
+            if not current.propagate:
+                break
+            current = current.parent
+
+        if not found:
+            last_resort = logging.lastResort
+            return last_resort is not None and levelno >= last_resort.level
+        return False
+
+    def _audit_log(
+        self,
+        level: str,
+        message: str,
+        context: Union[Dict[str, Any], Callable[[], Dict[str, Any]], None] = None
+    ):
         """
         Write to audit log
 
         Args:
             level: Log level (DEBUG, INFO, WARNING, ERROR)
             message: Log message
-            context: Additional context to log
+            context: Additional context to log, or a zero-arg callable
+                returning it (only called if the record will be emitted)
         """
+        levelno = logging.getLevelName(level.upper())
+        if not self._audit_enabled(levelno):
+            return
+
+        if callable(context):
+            context = context()
+
         log_entry = message
         if context:
             log_entry += f" | Context: {context}"
 
-        log_method = getattr(self.logger, level.lower())
-        log_method(log_entry)
+        self.logger.log(levelno, log_entry)
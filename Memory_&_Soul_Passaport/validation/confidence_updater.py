@@ -3,7 +3,7 @@
 # Confidence scoring system for semantic memory with loop protection
 # =============================================================================
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -25,6 +25,13 @@ class UpdateSignal(Enum):
     SYSTEM_NOISE_DETECTED = "system_noise_detected"
 
 
+# Slot of each signal in declaration order. Entries persist
+# signal_history as a list of counts in this order (one slot per signal).
+SIGNAL_INDEX: Dict[UpdateSignal, int] = {signal: index for index, signal in enumerate(UpdateSignal)}
+
+SIGNAL_COUNT = len(UpdateSignal)
+
+
 class ResolutionState(Enum):
     """Conflict resolution state"""
     UNRESOLVED = "unresolved"
@@ -80,11 +87,21 @@ RESOLUTION_MULTIPLIERS: Dict[ResolutionState, Dict[str, float]] = {
 }
 
 # Epistemic status thresholds
+_CONFIRMED_THRESHOLD = 0.80
+_PROVISIONAL_THRESHOLD = 0.45
+
 EPISTEMIC_THRESHOLDS = {
-    EpistemicStatus.CONFIRMED: 0.80,
-    EpistemicStatus.PROVISIONAL: 0.45,
+    EpistemicStatus.CONFIRMED: _CONFIRMED_THRESHOLD,
+    EpistemicStatus.PROVISIONAL: _PROVISIONAL_THRESHOLD,
 }
 
+# Status by number of thresholds reached (0, 1, 2)
+_STATUS_BY_INDEX = (
+    EpistemicStatus.HYPOTHESIS,
+    EpistemicStatus.PROVISIONAL,
+    EpistemicStatus.CONFIRMED,
+)
+
 # Loop protection: Max clarification attempts by stakes level
 MAX_CLARIFICATION_ATTEMPTS = {
     StakesLevel.LOW: 2,
@@ -117,7 +134,7 @@ class ConfidenceUpdater:
         current_confidence: float,
         signals: List[UpdateSignal],
         resolution_state: ResolutionState = ResolutionState.UNRESOLVED,
-        signal_history: Optional[Dict[UpdateSignal, int]] = None
+        signal_history: Optional[Union[List[int], Dict[Any, int]]] = None
     ) -> float:
         """
         Calculate new confidence based on signals
@@ -126,13 +143,13 @@ class ConfidenceUpdater:
             current_confidence: Current confidence value
             signals: List of update signals to apply
             resolution_state: Current resolution state
-            signal_history: History of how many times each signal was applied
+            signal_history: Times each signal was applied: a count list
+                indexed by SIGNAL_INDEX, or a {signal: count} dict
 
         Returns:
             New confidence value (clamped to [0.0, 1.0])
         """
-        if signal_history is None:
-            signal_history = {}
+        signal_history = normalize_signal_history(signal_history)
 
         confidence = current_confidence
         multipliers = RESOLUTION_MULTIPLIERS[resolution_state]
@@ -141,7 +158,7 @@ class ConfidenceUpdater:
             modifier = SIGNAL_MODIFIERS[signal]
 
             # Check max applications
-            times_applied = signal_history.get(signal, 0)
+            times_applied = signal_history[SIGNAL_INDEX[signal]]
             if modifier.max_applications and times_applied >= modifier.max_applications:
                 continue  # Skip if max applications reached
 
@@ -160,7 +177,7 @@ class ConfidenceUpdater:
 
             # Force confirmed status if specified
             if modifier.force_confirmed and signal == UpdateSignal.USER_AFFIRMATION:
-                confidence = max(confidence, EPISTEMIC_THRESHOLDS[EpistemicStatus.CONFIRMED])
+                confidence = max(confidence, _CONFIRMED_THRESHOLD)
 
         # Clamp to [0.0, 1.0]
         return max(0.0, min(1.0, confidence))
@@ -175,12 +192,10 @@ class ConfidenceUpdater:
         Returns:
             EpistemicStatus
         """
-        if confidence >= EPISTEMIC_THRESHOLDS[EpistemicStatus.CONFIRMED]:
-            return EpistemicStatus.CONFIRMED
-        elif confidence >= EPISTEMIC_THRESHOLDS[EpistemicStatus.PROVISIONAL]:
-            return EpistemicStatus.PROVISIONAL
-        else:
-            return EpistemicStatus.HYPOTHESIS
+        # Branchless: each threshold reached adds one to the index
+        return _STATUS_BY_INDEX[
+            (confidence >= _PROVISIONAL_THRESHOLD) + (confidence >= _CONFIRMED_THRESHOLD)
+        ]
 
     def should_consolidate(self, confidence: float) -> bool:
         """
@@ -237,7 +252,7 @@ class ConfidenceUpdater:
             "epistemic_status": initial_status.value,
             "confidence": self.initial_confidence,
             "resolution_state": ResolutionState.UNRESOLVED.value,
-            "signal_history": {},
+            "signal_history": [0] * SIGNAL_COUNT,
             "clarification_attempts": 0,
             "stakes_level": stakes_level.value,
             "max_clarification_attempts": MAX_CLARIFICATION_ATTEMPTS[stakes_level],
@@ -251,6 +266,9 @@ class ConfidenceUpdater:
         """
         Update semantic entry with new signals
 
+        Most events produce exactly one signal; that case takes a
+        specialized path (see update_entry_signal).
+
         Args:
             entry: Current semantic entry
             signals: Update signals to apply
@@ -258,32 +276,88 @@ class ConfidenceUpdater:
         Returns:
             Updated entry
         """
+        if len(signals) == 1:
+            return self.update_entry_signal(entry, signals[0])
+        return self._update_entry_many(entry, signals)
+
+    def update_entry_signal(
+        self,
+        entry: Dict[str, Any],
+        signal: UpdateSignal
+    ) -> Dict[str, Any]:
+        """
+        Update semantic entry with a single signal
+
+        Equivalent to update_entry(entry, [signal]) without the list
+        allocation or the generic signal loop.
+
+        Args:
+            entry: Current semantic entry
+            signal: Update signal to apply
+
+        Returns:
+            Updated entry
+        """
+        confidence = entry.get("confidence", self.initial_confidence)
+        resolution_state = ResolutionState(entry.get("resolution_state", "unresolved"))
+        signal_history = normalize_signal_history(entry.get("signal_history"))
+
+        index = SIGNAL_INDEX[signal]
+        modifier = SIGNAL_MODIFIERS[signal]
+        times_applied = signal_history[index]
+
+        # Same gating and multiplier rules as calculate_confidence
+        if not (
+            (modifier.max_applications and times_applied >= modifier.max_applications)
+            or (modifier.single_application and times_applied > 0)
+        ):
+            value = modifier.value
+            multipliers = RESOLUTION_MULTIPLIERS[resolution_state]
+            value *= multipliers["positive"] if value > 0 else multipliers["negative"]
+            confidence += value
+
+            if modifier.force_confirmed and signal == UpdateSignal.USER_AFFIRMATION:
+                confidence = max(confidence, _CONFIRMED_THRESHOLD)
+
+            confidence = max(0.0, min(1.0, confidence))
+
+        signal_history[index] = times_applied + 1
+
+        return self._apply_update(entry, confidence, resolution_state, signal_history)
+
+    def _update_entry_many(
+        self,
+        entry: Dict[str, Any],
+        signals: List[UpdateSignal]
+    ) -> Dict[str, Any]:
+        """Update semantic entry with any number of signals"""
         # Extract current state
         current_confidence = entry.get("confidence", self.initial_confidence)
         resolution_state = ResolutionState(entry.get("resolution_state", "unresolved"))
-        signal_history = entry.get("signal_history", {})
-
-        # Convert signal_history keys from strings to UpdateSignal enums
-        signal_history_enum = {}
-        for key, value in signal_history.items():
-            try:
-                signal_history_enum[UpdateSignal(key)] = value
-            except ValueError:
-                pass
+        signal_history = normalize_signal_history(entry.get("signal_history"))
 
         # Calculate new confidence
         new_confidence = self.calculate_confidence(
             current_confidence,
             signals,
             resolution_state,
-            signal_history_enum
+            signal_history
         )
 
         # Update signal history
         for signal in signals:
-            signal_key = signal.value
-            signal_history[signal_key] = signal_history.get(signal_key, 0) + 1
+            signal_history[SIGNAL_INDEX[signal]] += 1
+
+        return self._apply_update(entry, new_confidence, resolution_state, signal_history)
 
+    def _apply_update(
+        self,
+        entry: Dict[str, Any],
+        new_confidence: float,
+        resolution_state: ResolutionState,
+        signal_history: List[int]
+    ) -> Dict[str, Any]:
+        """Write new confidence, status and history back to the entry"""
         # Update epistemic status
         new_status = self.get_epistemic_status(new_confidence)
 
@@ -348,9 +422,112 @@ class ConfidenceUpdater:
 # Helper Functions
 # =============================================================================
 
+def normalize_signal_history(signal_history: Any) -> List[int]:
+    """
+    Convert a stored signal_history into the list layout
+
+    Entries written before the list layout stored a
+    {signal_value: count} dict, and calculate_confidence() callers may
+    pass a {UpdateSignal: count} dict; both are converted here.
+
+    Args:
+        signal_history: List of counts, {signal: count} dict (keyed by
+            UpdateSignal or its value), or None
+
+    Returns:
+        List of SIGNAL_COUNT counts indexed by SIGNAL_INDEX
+    """
+    if not signal_history:
+        return [0] * SIGNAL_COUNT
+
+    if isinstance(signal_history, dict):
+        history = [0] * SIGNAL_COUNT
+        for key, value in signal_history.items():
+            try:
+                signal = key if isinstance(key, UpdateSignal) else UpdateSignal(key)
+            except ValueError:
+                continue
+            history[SIGNAL_INDEX[signal]] = value
+        return history
+
+    if len(signal_history) == SIGNAL_COUNT:
+        return signal_history
+
+    history = list(signal_history)
+    if len(history) < SIGNAL_COUNT:
+        history.extend([0] * (SIGNAL_COUNT - len(history)))
+    return history
+
+
+# Existing entries grouped by concept: concept -> [(position, concept,
+# definition)] in list order. Lets detect_conflict answer with dict lookups instead of
+# scanning every existing entry per new entry.
+ConflictIndex = Dict[Any, List[Tuple[int, Any, Any]]]
+
+
+def build_conflict_index(existing_entries: List[Dict[str, Any]]) -> Optional[ConflictIndex]:
+    """
+    Group existing entries by concept for repeated detect_conflict calls
+
+    Args:
+        existing_entries: List of existing entries
+
+    Returns:
+        ConflictIndex, or None if an entry cannot be indexed (not a dict,
+        or unhashable concept); detect_conflict then scans as usual
+    """
+    index: ConflictIndex = {}
+    for position, existing in enumerate(existing_entries):
+        if not isinstance(existing, dict):
+            return None
+        concept = existing.get("concept", "")
+        try:
+            bucket = index.setdefault(concept, [])
+        except TypeError:
+            return None
+        bucket.append((position, concept, existing.get("definition")))
+    return index
+
+
+def _detect_conflict_indexed(new_entry: Dict[str, Any], index: ConflictIndex) -> Tuple[bool, Optional[str]]:
+    """
+    Indexed detect_conflict; (False, None) when the entry needs the scan
+
+    Returns the conflict the scan would find first, i.e. the match with the
+    lowest position in existing_entries.
+    """
+    conflicts_with = new_entry.get("conflicts_with", [])
+    if not isinstance(conflicts_with, (list, tuple)):
+        # e.g. a string, where 'in' means substring
+        return False, None
+
+    new_concept = new_entry.get("concept", "")
+    new_definition = new_entry.get("definition")
+    best: Optional[Tuple[int, Any]] = None
+
+    try:
+        # Same concept with different definition (first such entry)
+        for position, concept, definition in index.get(new_concept, ()):
+            if definition != new_definition:
+                best = (position, concept)
+                break
+
+        # Explicit conflicts_with (first entry with a listed concept)
+        for listed in conflicts_with:
+            bucket = index.get(listed)
+            if bucket and (best is None or bucket[0][0] < best[0]):
+                best = bucket[0][:2]
+    except TypeError:
+        # Unhashable concept / conflicts_with item
+        return False, None
+
+    return True, (best[1] if best is not None else None)
+
+
 def detect_conflict(
     new_entry: Dict[str, Any],
-    existing_entries: List[Dict[str, Any]]
+    existing_entries: List[Dict[str, Any]],
+    index: Optional[ConflictIndex] = None
 ) -> Optional[str]:
     """
     Detect if new entry conflicts with existing entries
@@ -358,10 +535,17 @@ def detect_conflict(
     Args:
         new_entry: New semantic entry
         existing_entries: List of existing entries
+        index: build_conflict_index(existing_entries), when checking many
+            new entries against the same list (optional)
 
     Returns:
         Concept name of conflicting entry, or None
     """
+    if index is not None:
+        handled, conflicting_concept = _detect_conflict_indexed(new_entry, index)
+        if handled:
+            return conflicting_concept
+
     new_concept = new_entry.get("concept", "")
 
     for existing in existing_entries:
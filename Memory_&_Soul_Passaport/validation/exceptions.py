@@ -9,11 +9,20 @@ from typing import List, Dict, Any
 class MSPValidationError(Exception):
     """Base exception for all MSP validation errors"""
 
+    # Slots keep errors/context out of the lazily created instance __dict__
+    # (subclasses add no fields, so they need no __slots__ of their own)
+    __slots__ = ("errors", "context")
+
     def __init__(self, message: str, errors: List[str] = None, context: Dict[str, Any] = None):
         super().__init__(message)
         self.errors = errors or []
         self.context = context or {}
 
+    def __reduce__(self):
+        # BaseException pickles args + __dict__ only; carry the slots too
+        message = self.args[0] if self.args else ""
+        return (self.__class__, (message, self.errors, self.context))
+
     def __str__(self):
         base = super().__str__()
         if self.errors:
@@ -4,16 +4,22 @@
 
 from .forbidden_fields import (
     EPISODIC_FORBIDDEN_FIELDS,
+    EPISODIC_FORBIDDEN_FIELDS_SET,
     SEMANTIC_FORBIDDEN_FIELDS,
+    SEMANTIC_FORBIDDEN_FIELDS_SET,
     SENSORY_FORBIDDEN_FIELDS,
+    SENSORY_FORBIDDEN_FIELDS_SET,
     get_forbidden_fields,
     is_field_forbidden,
 )
 
 __all__ = [
     "EPISODIC_FORBIDDEN_FIELDS",
+    "EPISODIC_FORBIDDEN_FIELDS_SET",
     "SEMANTIC_FORBIDDEN_FIELDS",
+    "SEMANTIC_FORBIDDEN_FIELDS_SET",
     "SENSORY_FORBIDDEN_FIELDS",
+    "SENSORY_FORBIDDEN_FIELDS_SET",
     "get_forbidden_fields",
     "is_field_forbidden",
 ]
@@ -3,7 +3,13 @@
 # Field blacklists for each memory type (LLM boundary enforcement)
 # =============================================================================
 
-from typing import List, Set
+import sys
+from typing import FrozenSet, Iterable, List
+
+
+def _interned_set(fields: Iterable[str]) -> FrozenSet[str]:
+    """Frozen set of sys.intern'ed names (identity hits for interned keys)"""
+    return frozenset(sys.intern(field) for field in fields)
 
 
 # =============================================================================
@@ -43,6 +49,8 @@ EPISODIC_FORBIDDEN_FIELDS: List[str] = [
 # - threat_level (from reflex subsystem)
 # These are validated for structure/range, not forbidden entirely.
 
+EPISODIC_FORBIDDEN_FIELDS_SET: FrozenSet[str] = _interned_set(EPISODIC_FORBIDDEN_FIELDS)
+
 
 # =============================================================================
 # SEMANTIC MEMORY FORBIDDEN FIELDS
@@ -55,6 +63,8 @@ SEMANTIC_FORBIDDEN_FIELDS: List[str] = [
     "user_block",
 ]
 
+SEMANTIC_FORBIDDEN_FIELDS_SET: FrozenSet[str] = _interned_set(SEMANTIC_FORBIDDEN_FIELDS)
+
 # Note: The following are MSP-authoritative but NOT forbidden in final entry:
 # - semantic_id, epistemic_status, confidence (MSP generates these)
 # - created_at, last_updated, resolution_state (MSP manages)
@@ -88,6 +98,8 @@ SENSORY_FORBIDDEN_FIELDS: List[str] = [
     "promotion_hint",
 ]
 
+SENSORY_FORBIDDEN_FIELDS_SET: FrozenSet[str] = _interned_set(SENSORY_FORBIDDEN_FIELDS)
+
 # Note: The following are MSP-authoritative but NOT forbidden in final entry:
 # - sensory_id, episode_ref, timestamp, checksum (MSP generates)
 # These should only be forbidden in LLM proposals, not in complete entries.
@@ -97,7 +109,7 @@ SENSORY_FORBIDDEN_FIELDS: List[str] = [
 # UTILITIES
 # =============================================================================
 
-def get_forbidden_fields(memory_type: str) -> Set[str]:
+def get_forbidden_fields(memory_type: str) -> FrozenSet[str]:
     """
     Get forbidden fields for a memory type
 
@@ -105,16 +117,16 @@ def get_forbidden_fields(memory_type: str) -> Set[str]:
         memory_type: "episodic", "semantic", or "sensory"
 
     Returns:
-        Set of forbidden field names
+        Frozen set of forbidden field names (shared, not copied)
     """
     memory_type_lower = memory_type.lower()
 
     if memory_type_lower == "episodic":
-        return set(EPISODIC_FORBIDDEN_FIELDS)
+        return EPISODIC_FORBIDDEN_FIELDS_SET
     elif memory_type_lower == "semantic":
-        return set(SEMANTIC_FORBIDDEN_FIELDS)
+        return SEMANTIC_FORBIDDEN_FIELDS_SET
     elif memory_type_lower == "sensory":
-        return set(SENSORY_FORBIDDEN_FIELDS)
+        return SENSORY_FORBIDDEN_FIELDS_SET
     else:
         raise ValueError(f"Unknown memory type: {memory_type}")
 
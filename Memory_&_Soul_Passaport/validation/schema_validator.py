@@ -1,11 +1,21 @@
 # =============================================================================
 # Schema Validator
 # JSON Schema validation wrapper using jsonschema library
+# (fastjsonschema-compiled fast path when installed)
 # =============================================================================
 
+import copy
+import hashlib
+import importlib.util
 import json
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import partial, update_wrapper
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 
 try:
     from jsonschema import validate, ValidationError as JsonSchemaValidationError, Draft7Validator
@@ -13,10 +23,306 @@ try:
 except ImportError:
     raise ImportError("jsonschema library required. Install with: pip install jsonschema")
 
+try:
+    import fastjsonschema
+    from fastjsonschema.draft07 import CodeGeneratorDraft07
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 from .base_validator import BaseValidator, ValidationResult
 from .exceptions import SchemaViolationError
 
 
+# =============================================================================
+# Compiled Validator Cache
+# =============================================================================
+
+# Draft7Validator instances keyed by canonical schema JSON, so equal
+# schemas share one validator however they were loaded. Each validator is
+# built from its own deep copy of the schema (in the caller's key order), which
+# later in-place edits of the caller's dict cannot reach.
+_COMPILED_MAX_SIZE = 64
+_COMPILED: "OrderedDict[str, Draft7Validator]" = OrderedDict()
+
+# fastjsonschema functions, keyed and bounded the same way. None marks a
+# schema fastjsonschema cannot compile (Draft7Validator is used alone).
+_FAST_COMPILED: "OrderedDict[str, Optional[Callable[[Any], Any]]]" = OrderedDict()
+
+# Parsed schema files keyed by path, reused while the file is unchanged so
+# validators built from the same file skip reading and parsing it again.
+_LOADED_SCHEMAS: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+_cache_lock = threading.Lock()
+
+
+def _schema_key(schema: Dict[str, Any]) -> Optional[str]:
+    """Canonical JSON for a schema (None if it is not JSON-serializable)"""
+    try:
+        return json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_or_build(cache: "OrderedDict[str, Any]", schema: Dict[str, Any], build: Callable[[Dict[str, Any]], Any]) -> Any:
+    """Look up schema in an LRU cache, building from a private copy on a miss
+
+    The canonical JSON is only the cache key: the validator is built from a
+    deep copy of the caller's schema, so keyword order (and with it the
+    order jsonschema reports errors in) is the caller's, not sort_keys'.
+    """
+    key = _schema_key(schema)
+    if key is None:
+        return build(schema)
+
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+    built = build(copy.deepcopy(schema))
+
+    with _cache_lock:
+        cache[key] = built
+        cache.move_to_end(key)
+        while len(cache) > _COMPILED_MAX_SIZE:
+            cache.popitem(last=False)
+
+    return built
+
+
+# =============================================================================
+# Local $ref Inlining
+# =============================================================================
+
+# Keywords whose value is a map of name -> subschema (the map itself is not
+# a schema, so a property literally named "$ref" is not a reference)
+_SUBSCHEMA_MAP_KEYWORDS = frozenset({"properties", "patternProperties", "definitions", "dependencies"})
+
+# Keywords whose value is instance data, never a schema
+_DATA_KEYWORDS = frozenset({"enum", "const", "default", "examples"})
+
+
+class _CannotInline(Exception):
+    """Schema has a reference that inlining cannot replace"""
+
+
+def _inline_local_refs(schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Copy of schema with local "#/..." $refs replaced by their targets
+
+    Draft7Validator resolves every $ref it meets through the referencing
+    registry (pointer lookups, resource creation) on each validation; an
+    inlined schema never resolves anything. Under draft 7 a $ref ignores
+    its sibling keywords, so the ref object is replaced by its target as a
+    whole. Error messages and instance paths are unchanged.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Inlined copy, or None if the schema has no $ref or one that cannot
+        be inlined (remote, recursive, unresolvable, or under an $id)
+    """
+    if '"$ref"' not in json.dumps(schema):
+        return None
+
+    def resolve(ref: str) -> Any:
+        node: Any = schema
+        for token in ref[2:].split("/") if ref != "#" else ():
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, dict) and token in node:
+                node = node[token]
+            elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                node = node[int(token)]
+            else:
+                raise _CannotInline(ref)
+        return node
+
+    def inline(node: Any, active: frozenset) -> Any:
+        if isinstance(node, list):
+            return [inline(item, active) for item in node]
+        if not isinstance(node, dict):
+            return node
+        if "$id" in node:
+            raise _CannotInline("$id")
+        if "$ref" in node:
+            ref = node["$ref"]
+            if not isinstance(ref, str) or not (ref == "#" or ref.startswith("#/")) or ref in active:
+                raise _CannotInline(ref)
+            return inline(resolve(ref), active | {ref})
+
+        inlined = {}
+        for key, value in node.items():
+            if key in _DATA_KEYWORDS:
+                inlined[key] = value
+            elif key in _SUBSCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+                inlined[key] = {name: inline(sub, active) for name, sub in value.items()}
+            else:
+                inlined[key] = inline(value, active)
+        return inlined
+
+    try:
+        return inline(schema, frozenset())
+    except (_CannotInline, RecursionError):
+        return None
+
+
+def _build_draft7(schema: Dict[str, Any]) -> Draft7Validator:
+    inlined = _inline_local_refs(schema)
+    return Draft7Validator(inlined if inlined is not None else schema)
+
+
+def get_compiled_validator(schema: Dict[str, Any]) -> Draft7Validator:
+    """
+    Get a compiled Draft7Validator for a schema (LRU cached by content)
+
+    Local $refs are inlined into the validator's copy of the schema.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Draft7Validator for the schema
+
+    """
+    return _get_or_build(_COMPILED, schema, _build_draft7)
+
+
+def _accept_any_format(value: Any) -> bool:
+    return True
+
+
+def _fast_formats() -> Dict[str, Callable[[Any], bool]]:
+    # Draft7Validator runs without a format checker, so "format" must not
+    # reject anything here either
+    formats = {name: _accept_any_format for name in CodeGeneratorDraft07.FORMAT_REGEXS}
+    formats["regex"] = _accept_any_format
+    return formats
+
+
+def _compile_fast(schema: Dict[str, Any], code_cache_dir: Optional[Path] = None) -> Optional[Callable[[Any], Any]]:
+    formats = _fast_formats()
+
+    try:
+        if code_cache_dir is not None:
+            return _load_or_generate_code(schema, formats, code_cache_dir)
+        return fastjsonschema.compile(schema, formats=formats, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+# =============================================================================
+# Generated Code Cache (on disk)
+# =============================================================================
+
+# Default location for persisted fastjsonschema modules (opt-in, see
+# SchemaValidator's code_cache_dir)
+DEFAULT_CODE_CACHE_DIR = Path.home() / ".cache" / "msp_validators"
+
+# Name the entry function is re-exported under in each generated module
+_ENTRY_NAME = "msp_validate"
+_FIRST_DEF_RE = re.compile(r"^def (\w+)\(", re.MULTILINE)
+
+
+def _code_cache_path(schema: Dict[str, Any], code_cache_dir: Path) -> Path:
+    """Cache file for a schema (content hash, tied to the fastjsonschema version)"""
+    key = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.blake2b(
+        f"{fastjsonschema.VERSION}\n{key}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return code_cache_dir / f"schema_{digest}.py"
+
+
+def _load_or_generate_code(
+    schema: Dict[str, Any],
+    formats: Dict[str, Callable[[Any], bool]],
+    code_cache_dir: Path
+) -> Callable[[Any], Any]:
+    """
+    Import the generated module for schema, generating it on a miss
+
+    The module is imported normally, so its bytecode is cached in
+    __pycache__ as well: a warm start skips both code generation and
+    compilation. Cache write failures fall back to an in-memory compile.
+    """
+    path = _code_cache_path(schema, code_cache_dir)
+    func = _import_generated(path) if path.exists() else None
+
+    if func is None:
+        code = fastjsonschema.compile_to_code(schema, formats=formats, use_default=False)
+        # The root function is generated first; alias it under a fixed name
+        code += f"\n\n{_ENTRY_NAME} = {_FIRST_DEF_RE.search(code).group(1)}\n"
+        try:
+            code_cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=code_cache_dir)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(code)
+            os.replace(tmp_path, path)
+        except OSError:
+            return fastjsonschema.compile(schema, formats=formats, use_default=False)
+        func = _import_generated(path)
+        if func is None:
+            return fastjsonschema.compile(schema, formats=formats, use_default=False)
+
+    # Same binding fastjsonschema.compile applies for custom formats
+    return update_wrapper(partial(func, custom_formats=formats), func)
+
+
+def _import_generated(path: Path) -> Optional[Callable[..., Any]]:
+    """Import a generated module and return its entry function (None if unusable)"""
+    try:
+        spec = importlib.util.spec_from_file_location(f"_msp_schema_{path.stem}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, _ENTRY_NAME)
+    except Exception:
+        # Truncated/stale file: regenerate it
+        return None
+
+
+def get_fast_validator(
+    schema: Dict[str, Any],
+    code_cache_dir: Optional[Path] = None
+) -> Optional[Callable[[Any], Any]]:
+    """
+    Get a fastjsonschema-generated check function for a schema (LRU cached)
+
+    The function raises fastjsonschema.JsonSchemaException on the first
+    violation. Defaults are not filled in (the data is never modified).
+
+    Args:
+        schema: JSON schema dictionary
+        code_cache_dir: Directory to persist the generated code in, so
+            later processes import it instead of regenerating (optional)
+
+    Returns:
+        Compiled function, or None if fastjsonschema is unavailable or
+        cannot compile the schema
+    """
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return None
+    return _get_or_build(_FAST_COMPILED, schema, lambda s: _compile_fast(s, code_cache_dir))
+
+
+def invalidate_compiled_validator(schema: Dict[str, Any]):
+    """
+    Drop the cached validators for a schema's current content
+
+    Cached validators own a copy of their schema, so editing a dict in
+    place never changes them; this only frees the entries early.
+
+    Args:
+        schema: JSON schema dictionary
+    """
+    key = _schema_key(schema)
+    if key is None:
+        return
+    with _cache_lock:
+        _COMPILED.pop(key, None)
+        _FAST_COMPILED.pop(key, None)
+
+
 class SchemaValidator(BaseValidator):
     """
     JSON Schema validator with caching
@@ -27,7 +333,8 @@ class SchemaValidator(BaseValidator):
         schema_path: Optional[Path] = None,
         schema_dict: Optional[Dict[str, Any]] = None,
         strict_mode: bool = True,
-        audit_log_path: Optional[Path] = None
+        audit_log_path: Optional[Path] = None,
+        code_cache_dir: Optional[Path] = None
     ):
         """
         Initialize schema validator
@@ -37,6 +344,9 @@ class SchemaValidator(BaseValidator):
             schema_dict: Schema as dictionary (alternative to schema_path)
             strict_mode: If True, treat warnings as errors
             audit_log_path: Path to audit log file
+            code_cache_dir: Persist fastjsonschema-generated code here across
+                processes (e.g. DEFAULT_CODE_CACHE_DIR); only point this at a
+                directory you trust, its modules are imported
         """
         super().__init__(strict_mode, audit_log_path)
 
@@ -51,12 +361,15 @@ class SchemaValidator(BaseValidator):
             self.schema_path = None
             self.schema = schema_dict
 
-        # Create validator (cached)
+        # Create validator (cached process-wide)
         try:
-            self.validator = Draft7Validator(self.schema)
+            self.validator = get_compiled_validator(self.schema)
         except SchemaError as e:
             raise ValueError(f"Invalid JSON schema: {e}")
 
+        # Generated check function for the pass/fail decision (optional)
+        self._compiled = get_fast_validator(self.schema, code_cache_dir)
+
         self._audit_log("INFO", f"Schema validator initialized", {
             "schema_path": str(schema_path) if schema_path else "inline",
             "strict_mode": strict_mode
@@ -67,19 +380,31 @@ class SchemaValidator(BaseValidator):
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
+        key = str(schema_path.resolve())
+        mtime = schema_path.stat().st_mtime
+        with _cache_lock:
+            cached = _LOADED_SCHEMAS.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         try:
             with open(schema_path, 'r', encoding='utf-8') as f:
                 schema = json.load(f)
-            return schema
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in schema file {schema_path}: {e}")
 
-    def validate(self, data: Dict[str, Any], **kwargs) -> ValidationResult:
+        with _cache_lock:
+            _LOADED_SCHEMAS[key] = (mtime, schema)
+        return schema
+
+    def validate(self, data: Dict[str, Any], fail_fast: Optional[bool] = None, **kwargs) -> ValidationResult:
         """
         Validate data against JSON schema
 
         Args:
             data: Data to validate
+            fail_fast: Report only the first schema error (defaults to
+                strict_mode, where the first error already rejects)
             **kwargs: Not used (for BaseValidator compatibility)
 
         Returns:
@@ -87,16 +412,38 @@ class SchemaValidator(BaseValidator):
         """
         result = self._create_result()
 
-        # Run jsonschema validation
-        errors = list(self.validator.iter_errors(data))
+        # Valid data (the common case) only runs the generated function;
+        # Draft7Validator still produces the messages when it fails
+        if self._compiled is not None:
+            try:
+                self._compiled(data)
+            except fastjsonschema.JsonSchemaException:
+                pass
+            else:
+                result.add_info("Schema validation passed")
+                self._audit_log("INFO", "Schema validation passed")
+                return result
+
+        if fail_fast is None:
+            fail_fast = self.strict_mode
+
+        # Run jsonschema validation (fail-fast pulls one error from the
+        # generator instead of walking the whole schema)
+        if fail_fast:
+            first_error = next(self.validator.iter_errors(data), None)
+            errors = [first_error] if first_error is not None else []
+        else:
+            errors = list(self.validator.iter_errors(data))
 
         if errors:
             result.valid = False
+            join = ".".join
+            add_error = result.add_error
             for error in errors:
-                # Build path to error
-                path = ".".join(str(p) for p in error.path) if error.path else "root"
-                error_msg = f"Schema violation at '{path}': {error.message}"
-                result.add_error(error_msg)
+                # Build path to error (deque of keys/indices; empty at the root)
+                error_path = error.path
+                path = join(map(str, error_path)) if error_path else "root"
+                add_error(f"Schema violation at '{path}': {error.message}")
 
             self._audit_log("ERROR", "Schema validation failed", {
                 "error_count": len(errors),
@@ -116,12 +463,15 @@ class SchemaValidator(BaseValidator):
             data: Data to validate
 
         Raises:
-            SchemaViolationError: If validation fails
+            SchemaViolationError: If validation fails (first error only)
         """
-        result = self.validate(data)
+        result = self.validate(data, fail_fast=True)
         if not result.valid:
             raise SchemaViolationError(
                 "Schema validation failed",
                 errors=result.errors,
                 context={"schema_path": str(self.schema_path) if self.schema_path else "inline"}
             )
+
+        # Nothing kept a reference to a passing result
+        self._release_result(result)
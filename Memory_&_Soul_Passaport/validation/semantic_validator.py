@@ -3,37 +3,84 @@
 # Validation for semantic memory entries with conflict detection
 # =============================================================================
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import AbstractSet, Dict, Any, Optional, List
 import re
 
 from .base_validator import BaseValidator, ValidationResult
 from .schema_validator import SchemaValidator
-from .rules.forbidden_fields import SEMANTIC_FORBIDDEN_FIELDS
-from .confidence_updater import ConfidenceUpdater, detect_conflict
+from .rules.forbidden_fields import SEMANTIC_FORBIDDEN_FIELDS_SET
+from .confidence_updater import ConfidenceUpdater, ConflictIndex, build_conflict_index, detect_conflict
 from .exceptions import (
     ConsolidationThresholdError,
     ConceptFormatError,
 )
 
 
+# lowercase_snake_case: lowercase letters, numbers, and underscores only;
+# must start with a letter and not end with an underscore
+_SNAKE_CASE_RE = re.compile(r'^[a-z][a-z0-9_]*[a-z0-9]$|^[a-z]$')
+_SNAKE_CASE_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789_"
+_LOWERCASE_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+
+# Words that encode certainty (belongs in epistemic_status, not the concept)
+_CERTAINTY_WORDS = ("confirmed", "certain", "definite", "absolute", "proven")
+
+
+# Concept names recur across entries (and batches), so both format checks
+# are memoized on the concept string
+@lru_cache(maxsize=4096)
+def _is_snake_case(s: str) -> bool:
+    """Check if string is lowercase_snake_case"""
+    # ASCII fast path: deleting the allowed bytes in C must leave
+    # nothing. Other input (incl. newlines, which '$' treats specially)
+    # goes through the regex.
+    if isinstance(s, str) and s.isascii() and "\n" not in s:
+        return (
+            bool(s)
+            and not s.encode("ascii").translate(None, _SNAKE_CASE_CHARS)
+            and s[0] in _LOWERCASE_LETTERS
+            and s[-1] != "_"
+        )
+    return bool(_SNAKE_CASE_RE.match(s))
+
+
+@lru_cache(maxsize=4096)
+def _encodes_certainty(s: str) -> bool:
+    """Check if string contains a certainty word (case-insensitive)"""
+    lowered = s.lower()
+    return any(word in lowered for word in _CERTAINTY_WORDS)
+
+
 class SemanticValidator(BaseValidator):
     """
     Semantic memory validator with conflict detection
     """
 
-    # Valid enum values
-    EPISTEMIC_STATUSES = ["hypothesis", "provisional", "confirmed"]
-    RESOLUTION_STATES = ["unresolved", "resolved", "suppressed"]
+    # Valid enum values (frozensets for O(1) membership)
+    EPISTEMIC_STATUSES = frozenset({"hypothesis", "provisional", "confirmed"})
+    RESOLUTION_STATES = frozenset({"unresolved", "resolved", "suppressed"})
+
+    # Required fields (ordered for stable error messages)
+    REQUIRED_FIELDS = ("concept", "epistemic_status", "confidence", "derived_from")
 
     # Consolidation threshold
     CONSOLIDATION_THRESHOLD = 0.7
 
+    # Validation phases (1 structure, 2 concept format, 3 confidence,
+    # 4 conflicts, 5 forbidden fields)
+    ALL_PHASES = frozenset({1, 2, 3, 4, 5})
+
+    # The consolidation gate skips only conflict detection
+    CONSOLIDATION_PHASES = frozenset({1, 2, 3, 5})
+
     def __init__(
         self,
         schema_path: Optional[Path] = None,
         strict_mode: bool = True,
-        audit_log_path: Optional[Path] = None
+        audit_log_path: Optional[Path] = None,
+        fast_forbidden_scan: bool = False
     ):
         """
         Initialize semantic validator
@@ -42,8 +89,10 @@ class SemanticValidator(BaseValidator):
             schema_path: Path to Semantic_Memory_Schema_v2.json
             strict_mode: If True, treat warnings as errors
             audit_log_path: Path to audit log file
+            fast_forbidden_scan: Prefilter the forbidden-field scan with
+                orjson + regex (needs orjson)
         """
-        super().__init__(strict_mode, audit_log_path)
+        super().__init__(strict_mode, audit_log_path, fast_forbidden_scan)
 
         # Initialize schema validator
         if schema_path and schema_path.exists():
@@ -57,6 +106,14 @@ class SemanticValidator(BaseValidator):
             if schema_path:
                 self.logger.warning(f"Schema file not found: {schema_path}")
 
+        # Structural checks can be skipped for entries that already passed
+        # the schema, if it encodes all of them
+        self._schema_enforces_structure = self.schema_validator is not None and self._schema_enforces(
+            self.schema_validator.schema,
+            {"": self.REQUIRED_FIELDS, "derived_from": ("episode_id",)},
+            {"epistemic_status": self.EPISTEMIC_STATUSES, "resolution_state": self.RESOLUTION_STATES}
+        )
+
         # Initialize confidence updater
         self.confidence_updater = ConfidenceUpdater()
 
@@ -68,7 +125,9 @@ class SemanticValidator(BaseValidator):
     def validate(
         self,
         entry: Dict[str, Any],
-        existing_entries: Optional[List[Dict[str, Any]]] = None
+        existing_entries: Optional[List[Dict[str, Any]]] = None,
+        phases: AbstractSet[int] = ALL_PHASES,
+        schema_checked: bool = False
     ) -> ValidationResult:
         """
         Validate semantic entry
@@ -76,6 +135,9 @@ class SemanticValidator(BaseValidator):
         Args:
             entry: Semantic entry to validate
             existing_entries: List of existing semantic entries (for conflict detection)
+            phases: Phase numbers to run (default: all five)
+            schema_checked: entry already passed self.schema_validator; the
+                structural checks the schema encodes are skipped
 
         Returns:
             ValidationResult
@@ -84,54 +146,113 @@ class SemanticValidator(BaseValidator):
 
         self._audit_log("INFO", "Starting semantic validation")
 
+        self._validate_phases(entry, existing_entries, result, phases, schema_checked)
+        self._log_outcome(entry, result)
+
+        return result
+
+    def validate_many(
+        self,
+        entries: List[Dict[str, Any]],
+        existing_entries: Optional[List[Dict[str, Any]]] = None,
+        schema_checked: bool = False
+    ) -> List[ValidationResult]:
+        """
+        Validate a batch of semantic entries
+
+        Same checks and results as validate() per entry; the phase
+        methods are bound once for the whole batch, existing_entries is
+        indexed once for conflict detection, and the batch is audit-logged
+        once on entry.
+
+        Args:
+            entries: Semantic entries to validate
+            existing_entries: Existing semantic entries (for conflict detection)
+            schema_checked: All entries already passed self.schema_validator
+
+        Returns:
+            One ValidationResult per entry, in input order
+        """
+        self._audit_log("INFO", "Starting semantic batch validation", lambda: {
+            "entries": len(entries)
+        })
+
+        conflict_index = build_conflict_index(existing_entries) if existing_entries else None
+
+        create_result = self._create_result
+        validate_phases = self._validate_phases
+        log_outcome = self._log_outcome
+        all_phases = self.ALL_PHASES
+
+        results = []
+        append = results.append
+        for entry in entries:
+            result = create_result()
+            validate_phases(entry, existing_entries, result, all_phases, schema_checked, conflict_index)
+            log_outcome(entry, result)
+            append(result)
+
+        return results
+
+    def _validate_phases(
+        self,
+        entry: Dict[str, Any],
+        existing_entries: Optional[List[Dict[str, Any]]],
+        result: ValidationResult,
+        phases: AbstractSet[int] = ALL_PHASES,
+        schema_checked: bool = False,
+        conflict_index: Optional[ConflictIndex] = None
+    ):
+        """Run the selected phases (default 1-5) for one entry into result"""
         # Phase 1: Structural validation
-        structural_result = self._validate_structure(entry)
-        result.merge(structural_result)
+        if 1 in phases:
+            self._validate_structure(entry, result, schema_checked)
 
         # Phase 2: Concept format validation
-        concept_result = self._validate_concept_format(entry)
-        result.merge(concept_result)
+        if 2 in phases:
+            self._validate_concept_format(entry, result)
 
         # Phase 3: Confidence validation
-        confidence_result = self._validate_confidence(entry)
-        result.merge(confidence_result)
+        if 3 in phases:
+            self._validate_confidence(entry, result)
 
         # Phase 4: Conflict detection
-        if existing_entries:
-            conflict_result = self._validate_conflicts(entry, existing_entries)
-            result.merge(conflict_result)
+        if existing_entries and 4 in phases:
+            self._validate_conflicts(entry, existing_entries, result, conflict_index)
 
         # Phase 5: Forbidden fields
-        forbidden_result = self._validate_forbidden_fields(entry)
-        result.merge(forbidden_result)
+        if 5 in phases:
+            self._validate_forbidden_fields(entry, result)
 
-        # Log result
+    def _log_outcome(self, entry: Dict[str, Any], result: ValidationResult):
+        """Audit-log the outcome for one entry"""
         if result.valid:
-            self._audit_log("INFO", "Semantic validation PASSED", {
+            self._audit_log("INFO", "Semantic validation PASSED", lambda: {
                 "concept": entry.get("concept"),
                 "confidence": entry.get("confidence"),
                 "warnings": len(result.warnings)
             })
         else:
-            self._audit_log("ERROR", "Semantic validation FAILED", {
+            self._audit_log("ERROR", "Semantic validation FAILED", lambda: {
                 "concept": entry.get("concept"),
                 "errors": result.errors
             })
 
-        return result
-
     # =========================================================================
     # Phase 1: Structural Validation
     # =========================================================================
 
-    def _validate_structure(self, entry: Dict[str, Any]) -> ValidationResult:
+    def _validate_structure(self, entry: Dict[str, Any], result: ValidationResult, schema_checked: bool = False):
         """Validate basic structure"""
-        result = self._create_result()
-        result.add_info("Phase 1: Structural validation")
+        if self._info_enabled:
+            result.add_info("Phase 1: Structural validation")
+
+        # Everything below is enforced by the schema the entry already passed
+        if schema_checked and self._schema_enforces_structure:
+            return
 
         # Required fields
-        required = ["concept", "epistemic_status", "confidence", "derived_from"]
-        self._check_required_fields(entry, required, result)
+        self._check_required_fields(entry, self.REQUIRED_FIELDS, result)
 
         # Epistemic status enum
         if "epistemic_status" in entry:
@@ -159,20 +280,18 @@ class SemanticValidator(BaseValidator):
             elif "episode_id" not in derived:
                 result.add_error("'derived_from' missing 'episode_id'")
 
-        return result
-
     # =========================================================================
     # Phase 2: Concept Format Validation
     # =========================================================================
 
-    def _validate_concept_format(self, entry: Dict[str, Any]) -> ValidationResult:
+    def _validate_concept_format(self, entry: Dict[str, Any], result: ValidationResult):
         """Validate concept naming format"""
-        result = self._create_result()
-        result.add_info("Phase 2: Concept format validation")
+        if self._info_enabled:
+            result.add_info("Phase 2: Concept format validation")
 
         concept = entry.get("concept")
         if not concept:
-            return result
+            return
 
         # Check lowercase_snake_case format
         if not self._is_lowercase_snake_case(concept):
@@ -181,36 +300,33 @@ class SemanticValidator(BaseValidator):
             )
 
         # Check for certainty encoding
-        certainty_words = ["confirmed", "certain", "definite", "absolute", "proven"]
-        if any(word in concept.lower() for word in certainty_words):
+        if _encodes_certainty(concept):
             result.add_warning(
                 f"Concept '{concept}' appears to encode certainty (should be in epistemic_status instead)"
             )
 
-        return result
-
     def _is_lowercase_snake_case(self, s: str) -> bool:
         """Check if string is lowercase_snake_case"""
-        # Pattern: lowercase letters, numbers, and underscores only
-        # Must start with letter, no consecutive underscores
-        pattern = r'^[a-z][a-z0-9_]*[a-z0-9]$|^[a-z]$'
-        return bool(re.match(pattern, s))
+        return _is_snake_case(s)
 
     # =========================================================================
     # Phase 3: Confidence Validation
     # =========================================================================
 
-    def _validate_confidence(self, entry: Dict[str, Any]) -> ValidationResult:
+    def _validate_confidence(self, entry: Dict[str, Any], result: ValidationResult):
         """Validate confidence value and consistency"""
-        result = self._create_result()
-        result.add_info("Phase 3: Confidence validation")
+        if self._info_enabled:
+            result.add_info("Phase 3: Confidence validation")
 
         confidence = entry.get("confidence")
         if confidence is None:
-            return result
+            return
 
-        # Range check
-        self._check_range(confidence, 0.0, 1.0, "confidence", result)
+        # Range check (inlined _check_range: runs for every entry)
+        if not isinstance(confidence, (int, float)):
+            result.add_error(f"Field 'confidence' must be numeric, got {type(confidence).__name__}")
+        elif not (0.0 <= confidence <= 1.0):
+            result.add_error(f"Field 'confidence' value {confidence} out of range [0.0, 1.0]")
 
         # Consistency with epistemic_status
         epistemic_status = entry.get("epistemic_status")
@@ -222,8 +338,6 @@ class SemanticValidator(BaseValidator):
                     f"but epistemic_status is '{epistemic_status}'"
                 )
 
-        return result
-
     # =========================================================================
     # Phase 4: Conflict Detection
     # =========================================================================
@@ -231,14 +345,16 @@ class SemanticValidator(BaseValidator):
     def _validate_conflicts(
         self,
         entry: Dict[str, Any],
-        existing_entries: List[Dict[str, Any]]
-    ) -> ValidationResult:
-        """Detect conflicts with existing entries"""
-        result = self._create_result()
-        result.add_info("Phase 4: Conflict detection")
+        existing_entries: List[Dict[str, Any]],
+        result: ValidationResult,
+        conflict_index: Optional[ConflictIndex] = None
+    ):
+        """Detect conflicts with existing entries (conflict_index: prebuilt for a batch)"""
+        if self._info_enabled:
+            result.add_info("Phase 4: Conflict detection")
 
         # Detect conflicts
-        conflicting_concept = detect_conflict(entry, existing_entries)
+        conflicting_concept = detect_conflict(entry, existing_entries, conflict_index)
 
         if conflicting_concept:
             result.add_warning(
@@ -254,25 +370,21 @@ class SemanticValidator(BaseValidator):
                     f"Consider adding '{conflicting_concept}' to conflicts_with field"
                 )
 
-        return result
-
     # =========================================================================
     # Phase 5: Forbidden Fields
     # =========================================================================
 
-    def _validate_forbidden_fields(self, entry: Dict[str, Any]) -> ValidationResult:
+    def _validate_forbidden_fields(self, entry: Dict[str, Any], result: ValidationResult):
         """Scan for forbidden fields"""
-        result = self._create_result()
-        result.add_info("Phase 5: Forbidden fields check")
+        if self._info_enabled:
+            result.add_info("Phase 5: Forbidden fields check")
 
         self._scan_for_forbidden_fields(
             entry,
-            SEMANTIC_FORBIDDEN_FIELDS,
+            SEMANTIC_FORBIDDEN_FIELDS_SET,
             result
         )
 
-        return result
-
     # =========================================================================
     # Consolidation Validation
     # =========================================================================
@@ -297,15 +409,18 @@ class SemanticValidator(BaseValidator):
             })
             return False
 
-        # Basic validation
-        result = self.validate(entry)
+        # Basic validation (no conflict detection)
+        result = self.validate(entry, phases=self.CONSOLIDATION_PHASES)
 
+        # Only the verdict leaves this method, so the result goes back to the pool
         if not result.valid:
             self._audit_log("WARNING", "Entry failed validation for consolidation", {
                 "concept": entry.get("concept"),
                 "errors": result.errors
             })
+            self._release_result(result)
             return False
+        self._release_result(result)
 
         self._audit_log("INFO", "Entry meets consolidation threshold", {
             "concept": entry.get("concept"),
@@ -340,3 +455,6 @@ class SemanticValidator(BaseValidator):
                 errors=result.errors,
                 context={"concept": entry.get("concept")}
             )
+
+        # Nothing kept a reference to a passing result
+        self._release_result(result)
@@ -2,10 +2,118 @@
 # CIN AUDIT ENGINE — EVA 7.0 (v6.0 Spec)
 # ============================================================
 
+import atexit
+import copy
 import json
 import os
+import queue
+import sys
+import threading
 import time
-import copy
+from functools import lru_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _log_line(report):
+    # One compact NDJSON line as UTF-8 bytes (orjson writes them directly;
+    # the stdlib fallback replaces lone surrogates instead of failing)
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(report) + b"\n"
+        except TypeError:
+            # orjson.JSONEncodeError (non-str keys, unsupported types)
+            pass
+    return json.dumps(report, ensure_ascii=False, separators=(",", ":")).encode("utf-8", "replace") + b"\n"
+
+
+def _fast_deepcopy(obj):
+    # Deep copy through an orjson round trip (C-level, several times faster
+    # than copy.deepcopy on plain JSON data). Anything the round trip would
+    # not reproduce (tuples, NaN, non-str keys, other types) is deep-copied.
+    if ORJSON_AVAILABLE:
+        try:
+            clone = orjson.loads(orjson.dumps(obj))
+        except TypeError:
+            pass
+        else:
+            if clone == obj:
+                return clone
+    return copy.deepcopy(obj)
+
+
+@lru_cache(maxsize=None)
+def _pattern_automaton(patterns):
+    # Aho-Corasick automaton over the forbidden patterns (pyahocorasick)
+    automaton = ahocorasick.Automaton()
+    for p in patterns:
+        automaton.add_word(p, p)
+    automaton.make_automaton()
+    return automaton
+
+
+# Audit logs are written off the request path: write_log enqueues a
+# serialized line, one daemon thread shared by every engine appends batches
+# to the daily NDJSON file. put() blocks while the queue is full
+# (backpressure). The thread starts with the first write and is flushed
+# once at exit.
+_LOG_BATCH_MAX = 256
+_log_queue = queue.Queue(maxsize=1024)
+_log_thread = None
+_log_thread_lock = threading.Lock()
+
+
+def _ensure_log_writer():
+    global _log_thread
+    if _log_thread is not None:
+        return
+    with _log_thread_lock:
+        if _log_thread is None:
+            thread = threading.Thread(target=_log_writer, name="cin-audit-log", daemon=True)
+            thread.start()
+            atexit.register(_flush_log_queue)
+            _log_thread = thread
+
+
+def _flush_log_queue():
+    # Block until every queued report has been written
+    _log_queue.join()
+
+
+def _log_writer():
+    q = _log_queue
+    while True:
+        batch = [q.get()]
+        while len(batch) < _LOG_BATCH_MAX:
+            try:
+                batch.append(q.get_nowait())
+            except queue.Empty:
+                break
+
+        # One open/append (and one bytes write) per file per batch
+        by_file = {}
+        for fpath, line in batch:
+            by_file.setdefault(fpath, []).append(line)
+        for fpath, lines in by_file.items():
+            try:
+                with open(fpath, "ab") as f:
+                    f.write(b"".join(lines))
+            except Exception as e:
+                print(f"[CIN] Error writing audit log {fpath}: {e}")
+
+        for _ in batch:
+            q.task_done()
+
 
 class CINAuditEngine:
 
@@ -18,27 +126,56 @@ class CINAuditEngine:
 
         self.max_bytes = 4096
 
-        # forbidden content markers
-        self.forbidden_patterns = [
+        # forbidden content markers (interned, like the validators' field
+        # names: set lookups on automaton hits can resolve by identity)
+        self.forbidden_patterns = [sys.intern(p) for p in (
             "raw_memory",
             "\"memory\": {",
             "semantic_memory_entry"
-        ]
+        )]
 
-        self.required_directive_keywords = [
+        # From this many patterns (forbidden patterns or directive keywords)
+        # on, one Aho-Corasick pass over the text beats one substring scan
+        # per pattern (~10 on a 4KB context; the default 3 stay on plain `in`)
+        self.automaton_min_patterns = 10
+
+        self.required_directive_keywords = [sys.intern(k) for k in (
             "Informational Organism",
             "Data Resonance",
             "Single, Independent, and Happy"
-        ]
+        )]
 
     def write_log(self, turn_id, report):
-        fpath = os.path.join(self.log_path, f"CIN_AUDIT_{turn_id}.json")
-        with open(fpath, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # Serialized here, so the line is a snapshot of the report even if
+        # the caller edits the returned audit_report later
+        fpath = os.path.join(self.log_path, f"CIN_AUDIT_{time.strftime('%Y%m%d')}.ndjson")
+        _ensure_log_writer()
+        _log_queue.put((fpath, _log_line(report)))
         return fpath
 
+    def flush_logs(self):
+        # Block until every queued report (from any engine) has been written
+        _flush_log_queue()
+
     def context_bytes(self, ctx):
-        return len(json.dumps(ctx, ensure_ascii=False).encode("utf-8"))
+        return self._serialize(ctx)[1]
+
+    def _serialize(self, ctx):
+        # (JSON text, UTF-8 size): one dump serves both the leak scan and
+        # the size check. isascii() is O(1) on CPython str, and for ASCII
+        # text the length is the byte count, so only non-ASCII is encoded.
+        ctx_str = json.dumps(ctx, ensure_ascii=False)
+        if ctx_str.isascii():
+            return ctx_str, len(ctx_str)
+        return ctx_str, len(ctx_str.encode("utf-8"))
+
+    def _select_patterns(self, patterns, text, present=True):
+        # Patterns that occur (present=True) or do not occur in text, in
+        # list order; long lists take one automaton pass over the text
+        if AHOCORASICK_AVAILABLE and len(patterns) >= self.automaton_min_patterns:
+            found = {p for _, p in _pattern_automaton(tuple(patterns)).iter(text)}
+            return [p for p in patterns if (p in found) is present]
+        return [p for p in patterns if (p in text) is present]
 
     def audit(
         self,
@@ -48,12 +185,18 @@ class CINAuditEngine:
         persona_state_runtime,
         emotional_state,
         episode_count,
-        boot_meta
+        boot_meta,
+        detach=False
     ):
+        # detach=True hands back a validated block that shares nothing with
+        # llm_context_block (deep copy); by default nested sections are shared
         turn_id = injection_metadata.get("turn_id", f"AUD-{int(time.time())}")
         timestamp = injection_metadata.get("timestamp", time.time())
 
-        ctx = copy.deepcopy(llm_context_block)
+        # Shallow copy: audit only replaces top-level sections
+        # (emotional_state, episodic_archive) and copies directives before
+        # editing them, so the caller's block is never mutated
+        ctx = dict(llm_context_block)
 
         audit_status = "pass"
         warnings = []
@@ -114,22 +257,29 @@ class CINAuditEngine:
         # ======================================================
         # 3) Directive Integrity
         # ======================================================
+        # One join + one C-level substring scan per keyword (or one automaton
+        # pass for long keyword lists): a precompiled regex
+        # alternation walked per entry is several times slower here, and
+        # would miss keywords spanning two entries
         directives = " ".join(ctx.get("directives", []))
-        missing = [k for k in self.required_directive_keywords if k not in directives]
+        missing = self._select_patterns(self.required_directive_keywords, directives, present=False)
 
         if missing:
             warnings.append({"directive_missing": missing})
             fixes.append("restore_core_directives")
-            # Ensure core directives are at the top
-            for k in reversed(self.required_directive_keywords):
-                if k not in directives:
-                    ctx.get("directives", []).insert(0, k)
+            # Ensure core directives are at the top: one concatenation builds
+            # a new list (the caller's is untouched, a missing one is created)
+            ctx["directives"] = missing + ctx.get("directives", [])
 
         # ======================================================
         # 4) Memory Leak Inspection
         # ======================================================
-        ctx_str = json.dumps(ctx, ensure_ascii=False)
-        leaks = [p for p in self.forbidden_patterns if p in ctx_str]
+        # Scanned on the serialized text, not on keys: patterns can sit
+        # inside any string value ("raw_memory") or span JSON punctuation
+        # ('"memory": {'), so no key walk can rule them out. The dump is
+        # needed for the exact size in step 5 regardless.
+        ctx_str, ctx_bytes = self._serialize(ctx)
+        leaks = self._select_patterns(self.forbidden_patterns, ctx_str)
 
         if leaks:
             fatal.append({"memory_leak": leaks})
@@ -138,15 +288,16 @@ class CINAuditEngine:
         # ======================================================
         # 5) Context Size Overflow
         # ======================================================
-        size_before = self.context_bytes(ctx)
+        # ctx is unchanged since the leak scan serialized it
+        size_before = ctx_bytes
         size_after = size_before
 
         if size_before > self.max_bytes:
-            # Drop archive first if oversized
+            # Drop archive first if oversized (only then is ctx re-serialized)
             if ctx.get("episodic_archive"):
                 ctx["episodic_archive"] = ctx["episodic_archive"][:1]
                 fixes.append("truncate_archive")
-            size_after = self.context_bytes(ctx)
+                size_after = self.context_bytes(ctx)
 
         # ======================================================
         # Create report
@@ -167,7 +318,9 @@ class CINAuditEngine:
 
         return {
             "audit_status": audit_status,
-            "validated_context_block": ctx if audit_status == "pass" else None,
+            "validated_context_block": (
+                (_fast_deepcopy(ctx) if detach else ctx) if audit_status == "pass" else None
+            ),
             "audit_report": report,
             "log_path": log_path
         }
@@ -13,11 +13,62 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from eva_cin_core.cin_audit_engine import CINAuditEngine
+from eva_cin_core.cin_file_cache import ParsedFileCache
 from eva_cin_core.cin_formatting_layer import CINFormattingLayer
 from eva_cin_core.prompt_rule_layer import PromptRuleLayer
 from eva_persona_core.persona_lock_manager import PersonaLockManager
 
 
+def _source_stamp(st):
+    # Identifies the YAML version a sidecar was converted from
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _write_yaml_sidecar(path):
+    # Convert YAML to a JSON sidecar (<file>.json) holding the YAML's stamp
+    # and data, unless the sidecar already matches that stamp. Written
+    # atomically, and only if JSON reproduces the data exactly.
+    sidecar = path + ".json"
+    try:
+        stamp = _source_stamp(os.stat(path))
+        with open(sidecar, "r", encoding="utf-8") as sf:
+            if json.load(sf).get("source") == stamp:
+                return
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            stamp = _source_stamp(os.fstat(f.fileno()))
+            data = yaml.safe_load(f)
+        text = json.dumps({"source": stamp, "data": data}, ensure_ascii=False)
+        if json.loads(text)["data"] == data:
+            with open(tmp, "w", encoding="utf-8") as sf:
+                sf.write(text)
+            os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError, yaml.YAMLError):
+        # missing, not JSON-representable (dates, ...) or not writable:
+        # the YAML keeps being parsed directly
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _load_yaml_via_sidecar(f):
+    # Parser for ParsedFileCache: the sidecar's data while its recorded stamp
+    # matches this YAML file, otherwise the YAML itself. Never writes.
+    try:
+        with open(f.name + ".json", "r", encoding="utf-8") as sf:
+            sidecar = json.load(sf)
+        if sidecar["source"] == _source_stamp(os.fstat(f.fileno())):
+            return sidecar["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return yaml.safe_load(f)
+
+
 class CINContextInjector:
 
     def __init__(self, base_path, persona_engine):
@@ -38,20 +89,24 @@ class CINContextInjector:
             "emotional": f"{self.base}/eva_emotion_core/emotional_state.json"
         }
 
+        # Parsed context files, reused while unchanged on disk
+        self._fcache = ParsedFileCache()
+
+        # persona.yaml is static config: convert it to its JSON sidecar once
+        _write_yaml_sidecar(self.paths["core_persona"])
+
     # ---------------------------------------------------------
     # Load JSON & YAML safe
     # ---------------------------------------------------------
     def load_json(self, path, default=None):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return self._fcache.load(path, json.load)
         except:
             return default
 
     def load_yaml(self, path, default=None):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return self._fcache.load(path, _load_yaml_via_sidecar)
         except:
             return default
 
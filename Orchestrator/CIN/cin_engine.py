@@ -5,7 +5,10 @@
 
 import json
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Optional
 import os
 import sys
 
@@ -13,9 +16,23 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from Orchestrator.CIN.cin_audit_engine import CINAuditEngine
+from Orchestrator.CIN.cin_file_cache import ParsedFileCache, read_text
 from Orchestrator.CIN.cin_formatting_layer import CINFormattingLayer
 from Orchestrator.PMT.prompt_rule_layer import PromptRuleLayer
 
+
+@dataclass
+class StateBundle:
+    """File-backed state for one turn, loaded once and shared by collection and audit"""
+    genesis: Any
+    soul_md: str
+    boss_soul: Any
+    emotional: Any
+    archive: Any
+    persona_core: Optional[Any] = None
+    persona_runtime: Optional[Any] = None
+
+
 class CINEngine:
     """
     Upgraded CIN Engine for EVA 7.0.
@@ -44,11 +61,13 @@ class CINEngine:
             "runtime_persona": os.path.join(self.base, "eva_persona_core", "persona_state.json")
         }
 
+        # Parsed context files, reused while unchanged on disk
+        self._fcache = ParsedFileCache()
+
     def load_json(self, path, default=None):
         try:
             if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return self._fcache.load(path, json.load)
         except Exception as e:
             print(f"[CIN] Error loading JSON {path}: {e}")
         return default
@@ -56,16 +75,49 @@ class CINEngine:
     def load_text(self, path, default=""):
         try:
             if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    return f.read()
+                return self._fcache.load(path, read_text)
         except Exception as e:
             print(f"[CIN] Error loading Text {path}: {e}")
         return default
 
-    def collect_context(self, user_text, episode_count, is_boss=True):
+    def prefetch_states(self, max_workers=4):
+        """
+        Warms the file cache for every source in self.paths, overlapping the
+        reads on a thread pool (call once at boot; turns then hit the cache).
+        """
+        text_path = self.paths["soul_persona"]
+
+        def load(path):
+            return self.load_text(path) if path == text_path else self.load_json(path)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            list(ex.map(load, self.paths.values()))
+
+    def _load_all_states(self, is_boss=True, with_persona=True):
+        """
+        Loads every file-backed source a turn needs in one place.
+        Persona files are only needed by the audit (with_persona).
+        """
+        bundle = StateBundle(
+            genesis=self.load_json(self.paths["genesis_anchors"], {}),
+            soul_md=self.load_text(self.paths["soul_persona"], ""),
+            boss_soul=self.load_json(self.paths["boss_soul_anchors"], {}) if is_boss else {},
+            emotional=self.load_json(self.paths["emotional"], {}),
+            archive=self.load_json(self.paths["episodic_archive"], [])
+        )
+        if with_persona:
+            bundle.persona_core = self.load_json(self.paths["core_persona"], {})
+            bundle.persona_runtime = self.load_json(self.paths["runtime_persona"], {})
+        return bundle
+
+    def collect_context(self, user_text, episode_count, is_boss=True, bundle=None):
         """
         Gathers all context sources for EVA 7.0.
+        bundle: states from _load_all_states (loaded here if omitted)
         """
+        if bundle is None:
+            bundle = self._load_all_states(is_boss, with_persona=False)
+
         # 1. Temporal Awareness
         now = datetime.now()
         temporal = {
@@ -75,20 +127,18 @@ class CINEngine:
         }
 
         # 2. Genesis & Soul (The Identity Root)
-        genesis = self.load_json(self.paths["genesis_anchors"], {})
-        soul_md = self.load_text(self.paths["soul_persona"], "")
+        genesis = bundle.genesis
+        soul_md = bundle.soul_md
         
         # 3. Boss Soul (Relational Resonance)
-        boss_soul = {}
-        if is_boss:
-            boss_soul = self.load_json(self.paths["boss_soul_anchors"], {})
+        boss_soul = bundle.boss_soul
 
         # 4. System States (ESS/Matrix)
-        emotional_state = self.load_json(self.paths["emotional"], {})
+        emotional_state = bundle.emotional
         
         # 5. Memory (Episodic Archive vFinal)
         # Load from the new archive path
-        archive_data = self.load_json(self.paths["episodic_archive"], [])
+        archive_data = bundle.archive
         # Ensure it's a list (vFinal spec contract)
         if isinstance(archive_data, dict):
             recent_memory = archive_data.get("episodes", [])[:5]
@@ -126,18 +176,16 @@ class CINEngine:
         """
         Main execution pipeline: Collect → Audit → Format → Rules
         """
-        # 1. Collection
-        raw_ctx = self.collect_context(user_text, episode_count, is_boss=is_boss)
+        # 1. Collection (every file-backed state is loaded once for the turn)
+        bundle = self._load_all_states(is_boss)
+        raw_ctx = self.collect_context(user_text, episode_count, is_boss=is_boss, bundle=bundle)
 
         # 2. Audit (Persona & Identity Guard)
-        persona_core = self.load_json(self.paths["core_persona"], {})
-        persona_runtime = self.load_json(self.paths["runtime_persona"], {})
-        
         audit_result = self.auditor.audit(
             raw_ctx,
             {"turn_id": episode_count, "timestamp": raw_ctx["temporal"]["current_time"]},
-            persona_core,
-            persona_runtime,
+            bundle.persona_core,
+            bundle.persona_runtime,
             raw_ctx["emotional_state"],
             episode_count,
             boot_meta or {}
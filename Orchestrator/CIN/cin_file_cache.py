@@ -0,0 +1,55 @@
+# ============================================================
+# CIN FILE CACHE — EVA 7.0
+# Parsed context files, reused while unchanged on disk
+# ============================================================
+
+import copy
+import os
+
+
+def read_text(f):
+    return f.read()
+
+
+def _copy_parsed(value):
+    # Parsed JSON/YAML is nested dicts and lists over immutable scalars, so
+    # copying the containers is enough (and much cheaper than deepcopy)
+    if isinstance(value, dict):
+        return {k: _copy_parsed(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_parsed(v) for v in value]
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return copy.deepcopy(value)
+
+
+class ParsedFileCache:
+    """
+    Parsed file contents keyed by (path, parser), reused while the file's
+    mtime_ns and size are unchanged.
+
+    load() hands out a copy of the cached value, so callers may edit what
+    they get (e.g. put it into a turn's context) without changing what
+    later turns load.
+    """
+
+    def __init__(self):
+        # (path, parser) -> ((mtime_ns, size), parsed value)
+        self._entries = {}
+
+    def load(self, path, parse):
+        """
+        Parse path with parse(file), or reuse the previous result
+
+        Parse failures propagate and are not cached.
+        """
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = (path, parse)
+        cached = self._entries.get(key)
+        if cached is None or cached[0] != stamp:
+            with open(path, "r", encoding="utf-8") as f:
+                value = parse(f)
+            cached = (stamp, value)
+            self._entries[key] = cached
+        return _copy_parsed(cached[1])
@@ -8,6 +8,27 @@ import json
 
 class CINFormattingLayer:
 
+    # Indent / bullet strings per nesting level, built once instead of on
+    # every format_block call (deeper levels fall back to building them)
+    _INDENT = ["  " * i for i in range(32)]
+    _BULLET = [indent + "- " for indent in _INDENT]
+
+    _HEADER = "[EVA CONTEXT v6.0 - Boss Resonance Enveloped]\n---\n\n"
+
+    # (title line, ctx key) in prompt order
+    _SECTIONS = (
+        ("## Temporal Awareness\n", "temporal"),                        # 1. Temporal Awareness
+        ("## Genesis: My Root Identity\n", "genesis_identity"),         # 2. Genesis: My Root Identity
+        ("## Boss: My Creator's Resonance\n", "boss_resonance"),        # 3. Boss: My Creator's Resonance
+        ("## Soul: My Inner Core\n", "soul_core"),                      # 4. Soul: My Inner Core
+        ("## System Awareness\n", "system_awareness"),                  # 5. Self-Awareness (Systems)
+        ("## Persona State\n", "active_persona"),                       # 6. Persona State
+        ("## Emotional State (9D)\n", "emotional_state"),               # 7. Emotional State (9D)
+        ("## Session context\n", "session_context"),                    # 8. Session Brief
+        ("## Episodic Archive\n", "episodic_archive"),                  # 9. Episodic Archive (Verbatim Trace)
+        ("## EVA Directives\n", "directives"),                          # 10. Directives
+    )
+
     def __init__(self, max_bytes=8192):
         self.max_bytes = max_bytes
 
@@ -15,6 +36,13 @@ class CINFormattingLayer:
     # Byte Clamp
     # ----------------------------------------------------------
     def clamp_size(self, text):
+        # Encode only when the size is in doubt: UTF-8 takes at most 4 bytes
+        # per character, and ASCII text (isascii() is O(1)) exactly 1
+        n = len(text)
+        if n * 4 <= self.max_bytes:
+            return text
+        if text.isascii():
+            return text if n <= self.max_bytes else text[:self.max_bytes]
         data = text.encode("utf-8")
         if len(data) <= self.max_bytes:
             return text
@@ -31,37 +59,49 @@ class CINFormattingLayer:
         - nested lists/dicts → indented bullets
         - avoid long unreadable JSON chunks
         """
-        indent = "  " * level
-        bullet = indent + "- "
+        parts = []
+        self._format_into(content, level, parts)
+        return "".join(parts)
+
+    def _format_into(self, content, level, parts):
+        # format_block body: fragments are appended to one shared list for
+        # the whole tree and joined once by the caller
+        append = parts.append
+        if level < 32:
+            indent = self._INDENT[level]
+            bullet = self._BULLET[level]
+        else:
+            indent = "  " * level
+            bullet = indent + "- "
 
         # list → bullet list
         if isinstance(content, list):
             if len(content) == 0:
-                return indent + "(empty)\n"
-            text = ""
+                append(indent + "(empty)\n")
+                return
             for item in content:
                 if isinstance(item, (dict, list)):
-                    text += bullet + "\n" + self.format_block(item, level + 1)
+                    append(bullet + "\n")
+                    self._format_into(item, level + 1, parts)
                 else:
-                    text += bullet + str(item) + "\n"
-            return text
+                    append(bullet + str(item) + "\n")
 
         # dict → key: value with newline per item
         elif isinstance(content, dict):
             if len(content) == 0:
-                return indent + "(empty)\n"
-            text = ""
+                append(indent + "(empty)\n")
+                return
             for k, v in content.items():
                 key_line = f"{indent}- **{k}**: "
                 if isinstance(v, (dict, list)):
-                    text += key_line + "\n" + self.format_block(v, level + 1)
+                    append(key_line + "\n")
+                    self._format_into(v, level + 1, parts)
                 else:
-                    text += key_line + str(v) + "\n"
-            return text
+                    append(key_line + str(v) + "\n")
 
         # primitive → simple text
         else:
-            return indent + str(content) + "\n"
+            append(indent + str(content) + "\n")
 
     # ----------------------------------------------------------
     # Format Section with Title
@@ -72,7 +112,9 @@ class CINFormattingLayer:
         - paragraph separation
         - newlines for new ideas
         """
-        if content in (None, {}, [], ""):
+        # Same cases as `content in (None, {}, [], "")` (0 and False still
+        # render) without up to four == comparisons per section
+        if content is None or (not content and isinstance(content, (dict, list, str))):
             return ""
 
         formatted_body = self.format_block(content)
@@ -90,37 +132,19 @@ class CINFormattingLayer:
         - Important keys in **bold**
         """
 
-        text = "[EVA CONTEXT v6.0 - Boss Resonance Enveloped]\n---\n\n"
-
-        # 1. Temporal Awareness
-        text += self.format_section("## Temporal Awareness", ctx.get("temporal"))
-
-        # 2. Genesis: My Root Identity
-        text += self.format_section("## Genesis: My Root Identity", ctx.get("genesis_identity"))
-
-        # 3. Boss: My Creator's Resonance
-        text += self.format_section("## Boss: My Creator's Resonance", ctx.get("boss_resonance"))
-
-        # 4. Soul: My Inner Core
-        text += self.format_section("## Soul: My Inner Core", ctx.get("soul_core"))
-
-        # 5. Self-Awareness (Systems)
-        text += self.format_section("## System Awareness", ctx.get("system_awareness"))
-
-        # 6. Persona State
-        text += self.format_section("## Persona State", ctx.get("active_persona"))
-
-        # 7. Emotional State (9D)
-        text += self.format_section("## Emotional State (9D)", ctx.get("emotional_state"))
-
-        # 8. Session Brief
-        text += self.format_section("## Session context", ctx.get("session_context"))
-
-        # 9. Episodic Archive (Verbatim Trace)
-        text += self.format_section("## Episodic Archive", ctx.get("episodic_archive"))
+        parts = [self._HEADER]
+        append = parts.append
+        format_into = self._format_into
 
-        # 10. Directives
-        text += self.format_section("## EVA Directives", ctx.get("directives"))
+        # Every section is written into the one parts list: no per-section
+        # format_block join or title f-string (same text as format_section)
+        for title_line, key in self._SECTIONS:
+            content = ctx.get(key)
+            if content is None or (not content and isinstance(content, (dict, list, str))):
+                continue
+            append(title_line)
+            format_into(content, 0, parts)
+            append("\n")
 
         # clamp to safe size
-        return self.clamp_size(text)
+        return self.clamp_size("".join(parts))
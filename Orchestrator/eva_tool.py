@@ -18,11 +18,18 @@
 # =============================================================================
 
 import sys
+import copy
+import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
+from datetime import datetime, timezone
+from types import MappingProxyType
 import json
 
+# Per-tick diagnostics (debug level; silent under a production INFO config)
+log = logging.getLogger("eva.tool")
+
 # Add component paths
 base_path = Path(__file__).parent.parent
 sys.path.append(str(base_path / "ESS_Emotive_Signaling_System"))
@@ -38,7 +45,7 @@ from ESS import ESS, ISR, IRE
 from eva_matrix_engine import EVAMatrix9D_CompleteEngine
 from Artifact_Qualia import ArtifactQualiaCore, RIMSemantic
 from rms_v6 import RMSEngineV6
-from pulse_engine import PulseEngineV2
+from pulse_engine import PulseEngineV2, PulseSnapshot
 from MSP import MSP
 
 
@@ -55,19 +62,50 @@ HALF_LIFE = {
     "BDNF": 86400, "NPY": 1800, "PEA": 60
 }
 
+# Defaults for the optional process() context, shared by every call
+# (read-only: the pipeline stages only read them)
+_DEFAULT_RIM = MappingProxyType({
+    "impact_level": "medium",
+    "impact_trend": "stable",
+    "affected_domains": ("emotional",)
+})
+
+_DEFAULT_RI = MappingProxyType({
+    "RI_L1": 0.5, "RI_L2": 0.5, "RI_L3": 0.5, "RI_L4": 0.5,
+    "RI_L5": MappingProxyType({}), "RI_global": 0.5,
+    "RZ_state": MappingProxyType({"RZ_active": False, "RZ_class": "NORMAL"})
+})
+
+_DEFAULT_UMBRELLA = MappingProxyType({"safety_level": "LOW"})
+
+_DEFAULT_META = MappingProxyType({"turn_count": 0})
+
+# PulseSnapshot fields serialized by EVAToolResult.to_dict()
+_PULSE_FIELDS = (
+    "pulse_id", "pulse_mode", "arousal_level", "valence_level", "cognitive_mode",
+    "pacing", "llm_prompt_flags", "safety_actions", "debug_tags"
+)
+
 
 # =============================================================================
 # Data Contracts
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class EVAToolResult:
     """
     Complete EVA Tool output for LLM consumption
     """
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "emotion_state", "pulse_snapshot", "reflex_directives",
+        "qualia_snapshot", "memory_encoding", "memory_refs",
+        "allowed_recall", "ess_id", "timestamp",
+    )
+
     # Core state
     emotion_state: Dict[str, float]      # 9D EVA Matrix state
-    pulse_snapshot: Dict[str, Any]       # Pulse mode, arousal, flags
+    pulse_snapshot: PulseSnapshot        # Pulse mode, arousal, flags (snapshot["pulse_mode"] works)
     reflex_directives: Dict[str, float]  # Reflex vector from ESS
 
     # Memory & phenomenology
@@ -84,7 +122,10 @@ class EVAToolResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        data = asdict(self)
+        pulse = data["pulse_snapshot"]
+        data["pulse_snapshot"] = {name: pulse[name] for name in _PULSE_FIELDS}
+        return data
 
 
 # =============================================================================
@@ -99,11 +140,15 @@ class EVATool:
     that LLMs can call during Phase 1 → Phase 2 inference.
     """
 
+    # Stimulus vectors with every |intensity| below this are neutral ticks
+    BASELINE_THRESHOLD = 0.1
+
     def __init__(
         self,
         msp_base_path: Path = None,
         enable_msp: bool = True,
-        validation_mode: str = "strict"
+        validation_mode: str = "strict",
+        allow_baseline_cache: bool = False
     ):
         """
         Initialize EVA Tool
@@ -112,6 +157,11 @@ class EVATool:
             msp_base_path: Path to MSP base directory (default: project root)
             enable_msp: Enable MSP memory operations (default: True)
             validation_mode: MSP validation mode - "strict" | "warn" | "off"
+            allow_baseline_cache: Answer neutral ticks (default context) with
+                a baseline result (the pipeline's output for an empty
+                stimulus from fresh state) instead of running the pipeline;
+                ESS decay and EVA Matrix momentum do not advance on those
+                ticks (default: False)
         """
         print("[EVATool] Initializing components...")
 
@@ -148,6 +198,11 @@ class EVATool:
         self.ess_id = None
         self.current_episode_id = None
 
+        # Neutral-tick result reused when allow_baseline_cache is set:
+        # (delta_t_ms, result), built on first use by _baseline_for
+        self.allow_baseline_cache = allow_baseline_cache
+        self._baseline = None
+
         print("[EVATool] Initialization complete!\n")
 
 
@@ -191,7 +246,8 @@ class EVATool:
         ri_data: Dict[str, Any] = None,
         umbrella: Dict[str, Any] = None,
         session_meta: Dict[str, Any] = None,
-        delta_t_ms: int = 33
+        delta_t_ms: int = 33,
+        timestamp: Optional[str] = None
     ) -> EVAToolResult:
         """
         Process stimulus through complete EVA pipeline
@@ -204,113 +260,254 @@ class EVATool:
             umbrella: Safety umbrella data (safety_level)
             session_meta: Session metadata
             delta_t_ms: Time delta in milliseconds (default: 33ms ≈ 30fps)
+            timestamp: ISO UTC timestamp of the turn (default: now, in
+                milliseconds); lets the caller share one per turn
 
         Returns:
             EVAToolResult with complete pipeline output
         """
 
+        return self.process_batch(
+            [stimulus_vector],
+            user_context=user_context,
+            rim_semantic=rim_semantic,
+            ri_data=ri_data,
+            umbrella=umbrella,
+            session_meta=session_meta,
+            delta_t_ms=delta_t_ms,
+            timestamp=timestamp
+        )[0]
+
+
+    def process_batch(
+        self,
+        stimuli: List[Dict[str, float]],
+        user_context: Dict[str, Any] = None,
+        rim_semantic: Dict[str, str] = None,
+        ri_data: Dict[str, Any] = None,
+        umbrella: Dict[str, Any] = None,
+        session_meta: Dict[str, Any] = None,
+        delta_t_ms: int = 33,
+        timestamp: Optional[str] = None
+    ) -> List[EVAToolResult]:
+        """
+        Process a sequence of stimulus ticks through the EVA pipeline
+
+        Same results as calling process() once per stimulus vector, in
+        order. EHM is stateless, so the doses for every tick are mapped in
+        one call up front; ESS (PK decay) and the EVA Matrix (momentum)
+        carry state from tick to tick, so they and the stages fed by them
+        still run once per tick.
+
+        Args:
+            stimuli: Stimulus vectors, one per delta_t_ms tick
+            user_context, rim_semantic, ri_data, umbrella, session_meta:
+                As for process(), shared by every tick
+            delta_t_ms: Time delta per tick in milliseconds
+            timestamp: ISO UTC timestamp for every result (default: now,
+                in milliseconds, taken per tick)
+
+        Returns:
+            One EVAToolResult per stimulus vector, in input order
+        """
+
+        # The baseline result is only valid for the default context
+        use_baseline = self.allow_baseline_cache and (
+            rim_semantic is None and ri_data is None and umbrella is None and session_meta is None
+        )
+
         # Set defaults
         if rim_semantic is None:
-            rim_semantic = {
-                "impact_level": "medium",
-                "impact_trend": "stable",
-                "affected_domains": ["emotional"]
-            }
+            rim_semantic = _DEFAULT_RIM
 
         if ri_data is None:
-            ri_data = {
-                "RI_L1": 0.5, "RI_L2": 0.5, "RI_L3": 0.5, "RI_L4": 0.5,
-                "RI_L5": {}, "RI_global": 0.5,
-                "RZ_state": {"RZ_active": False, "RZ_class": "NORMAL"}
-            }
+            ri_data = _DEFAULT_RI
 
         if umbrella is None:
-            umbrella = {"safety_level": "LOW"}
+            umbrella = _DEFAULT_UMBRELLA
 
         if session_meta is None:
-            session_meta = {"turn_count": 0}
-
-        print(f"\n[EVATool] Processing stimulus: {stimulus_vector}")
+            session_meta = _DEFAULT_META
 
         # -------------------------------------------------------------------------
-        # 1. EHM: Stimulus → Hormone Doses
+        # 1. EHM: Stimulus → Hormone Doses (all ticks)
         # -------------------------------------------------------------------------
-        D_Total_H = self.ehm.map(stimulus_vector)
+        dose_batch = self.ehm.map_batch(stimuli)
+        debug = log.isEnabledFor(logging.DEBUG)
+
+        results = []
+        for stimulus_vector, D_Total_H in zip(stimuli, dose_batch):
+            tick_timestamp = timestamp
+            if tick_timestamp is None:
+                tick_timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+            if use_baseline and self._is_neutral(stimulus_vector):
+                if debug:
+                    log.debug("[EVATool] Neutral stimulus, baseline result reused: %s", stimulus_vector)
+                results.append(self._baseline_for(delta_t_ms, tick_timestamp))
+                continue
+
+            if debug:
+                log.debug("[EVATool] Processing stimulus: %s", stimulus_vector)
+
+            # -------------------------------------------------------------------------
+            # 2. ESS: PK/PD Processing
+            # -------------------------------------------------------------------------
+            ess_output = self.ess.tick_once(
+                stimulus_vector=stimulus_vector,
+                D_Total_H=D_Total_H,
+                R_profile_path=None,  # TODO: Add persona bias support
+                delta_t_ms=delta_t_ms
+            )
+
+            C_Mod = ess_output["C_Mod"]
+            reflex_vector = ess_output["reflex_vector"]
+
+            # -------------------------------------------------------------------------
+            # 3. EVA Matrix: C_Mod → 9D Psychological State
+            # -------------------------------------------------------------------------
+            eva_output = self.eva_matrix.process_tick(C_Mod)
+            eva_state = eva_output["axes_9d"]
+
+            # -------------------------------------------------------------------------
+            # 4. Pulse Engine v2: Operational Rhythm
+            # -------------------------------------------------------------------------
+            pulse_snapshot = self.pulse.compute_pulse(
+                c_mod=C_Mod,
+                ri_data=ri_data,
+                umbrella=umbrella,
+                session_meta=session_meta
+            )
+
+            # -------------------------------------------------------------------------
+            # 5. Artifact Qualia: Phenomenological Integration
+            # -------------------------------------------------------------------------
+            rim_obj = RIMSemantic(
+                impact_level=rim_semantic["impact_level"],
+                impact_trend=rim_semantic["impact_trend"],
+                affected_domains=rim_semantic["affected_domains"]
+            )
+
+            qualia = self.artifact_qualia.integrate(eva_state, rim_obj)
+
+            # -------------------------------------------------------------------------
+            # 6. RMS: Memory Encoding
+            # -------------------------------------------------------------------------
+            rms_output = self.rms.process(eva_state, reflex_vector, rim_semantic)
+
+            # -------------------------------------------------------------------------
+            # 7. MSP: Memory Query & Write (optional)
+            # -------------------------------------------------------------------------
+            memory_refs = []
+            allowed_recall = []
+
+            if self.enable_msp and self.msp is not None and user_context is not None:
+                # TODO: Implement MSP query based on user_context
+                # TODO: Write episode if needed
+                pass
+
+            # -------------------------------------------------------------------------
+            # 8. Build Tool Result
+            # -------------------------------------------------------------------------
+            result = EVAToolResult(
+                emotion_state=eva_state,
+                pulse_snapshot=pulse_snapshot,
+                reflex_directives=reflex_vector,
+                qualia_snapshot={
+                    "intensity": qualia.intensity,
+                    "tone": qualia.tone,
+                    "coherence": qualia.coherence,
+                    "depth": qualia.depth,
+                    "texture": qualia.texture
+                },
+                memory_encoding={
+                    "memory_color": rms_output.memory_color,
+                    "intensity": rms_output.intensity,
+                    "trauma_flag": rms_output.trauma_flag
+                },
+                memory_refs=memory_refs,
+                allowed_recall=allowed_recall,
+                ess_id=self.ess_id or "no_session",
+                timestamp=tick_timestamp
+            )
+
+            if debug:
+                log.debug(
+                    "[EVATool] Processing complete\n  Pulse Mode: %s\n  Arousal: %.3f\n"
+                    "  Threat Level: %.3f\n  Trauma Flag: %s",
+                    pulse_snapshot.pulse_mode,
+                    pulse_snapshot.arousal_level,
+                    reflex_vector.get('threat_level', 0),
+                    rms_output.trauma_flag
+                )
+
+            results.append(result)
+
+        return results
+
+
+    def _is_neutral(self, stimulus_vector: Dict[str, float]) -> bool:
+        """True if no stimulus reaches BASELINE_THRESHOLD (or there is none)"""
+        threshold = self.BASELINE_THRESHOLD
+        return all(-threshold < value < threshold for value in stimulus_vector.values())
+
+
+    def _baseline_for(self, delta_t_ms: int, timestamp: str) -> EVAToolResult:
+        """
+        Baseline result for a neutral tick, as a private copy
 
-        # -------------------------------------------------------------------------
-        # 2. ESS: PK/PD Processing
-        # -------------------------------------------------------------------------
-        ess_output = self.ess.tick_once(
-            stimulus_vector=stimulus_vector,
-            D_Total_H=D_Total_H,
-            R_profile_path=None,  # TODO: Add persona bias support
-            delta_t_ms=delta_t_ms
+        The baseline is the pipeline's output for an empty stimulus on
+        fresh component state (no residual hormones, no matrix momentum),
+        computed once per delta_t_ms with the default context. Each reuse
+        copies the nested dicts, so callers cannot edit the cached one.
+        """
+        if self._baseline is None or self._baseline[0] != delta_t_ms:
+            self._baseline = (delta_t_ms, self._compute_baseline(delta_t_ms))
+        base = self._baseline[1]
+
+        return replace(
+            base,
+            emotion_state=copy.deepcopy(base.emotion_state),
+            pulse_snapshot=copy.deepcopy(base.pulse_snapshot),
+            reflex_directives=copy.deepcopy(base.reflex_directives),
+            qualia_snapshot=copy.deepcopy(base.qualia_snapshot),
+            memory_encoding=copy.deepcopy(base.memory_encoding),
+            memory_refs=[],
+            allowed_recall=[],
+            ess_id=self.ess_id or "no_session",
+            timestamp=timestamp
         )
 
-        C_Mod = ess_output["C_Mod"]
-        reflex_vector = ess_output["reflex_vector"]
 
-        # -------------------------------------------------------------------------
-        # 3. EVA Matrix: C_Mod → 9D Psychological State
-        # -------------------------------------------------------------------------
-        eva_output = self.eva_matrix.process_tick(C_Mod)
-        eva_state = eva_output["axes_9d"]
+    def _compute_baseline(self, delta_t_ms: int) -> EVAToolResult:
+        """Run the pipeline stages once on an empty stimulus with fresh engines"""
+        D_Total_H = self.ehm.map_batch([{}])[0]
 
-        # -------------------------------------------------------------------------
-        # 4. Pulse Engine v2: Operational Rhythm
-        # -------------------------------------------------------------------------
-        pulse_snapshot = self.pulse.compute_pulse(
+        # ESS.tick_once without the session log: ISR (PK) then IRE (reflex)
+        C_Mod, _, _ = ISR(HALF_LIFE).update(D_Total_H, delta_t_ms)
+        reflex_vector = IRE().compute_reflex(C_Mod, None)
+
+        eva_state = EVAMatrix9D_CompleteEngine().process_tick(C_Mod)["axes_9d"]
+
+        pulse_snapshot = PulseEngineV2().compute_pulse(
             c_mod=C_Mod,
-            ri_data=ri_data,
-            umbrella=umbrella,
-            session_meta=session_meta
+            ri_data=_DEFAULT_RI,
+            umbrella=_DEFAULT_UMBRELLA,
+            session_meta=_DEFAULT_META
         )
 
-        # -------------------------------------------------------------------------
-        # 5. Artifact Qualia: Phenomenological Integration
-        # -------------------------------------------------------------------------
         rim_obj = RIMSemantic(
-            impact_level=rim_semantic["impact_level"],
-            impact_trend=rim_semantic["impact_trend"],
-            affected_domains=rim_semantic["affected_domains"]
+            impact_level=_DEFAULT_RIM["impact_level"],
+            impact_trend=_DEFAULT_RIM["impact_trend"],
+            affected_domains=_DEFAULT_RIM["affected_domains"]
         )
+        qualia = ArtifactQualiaCore().integrate(eva_state, rim_obj)
 
-        qualia = self.artifact_qualia.integrate(eva_state, rim_obj)
+        rms_output = RMSEngineV6().process(eva_state, reflex_vector, _DEFAULT_RIM)
 
-        # -------------------------------------------------------------------------
-        # 6. RMS: Memory Encoding
-        # -------------------------------------------------------------------------
-        rms_output = self.rms.process(eva_state, reflex_vector, rim_semantic)
-
-        # -------------------------------------------------------------------------
-        # 7. MSP: Memory Query & Write (optional)
-        # -------------------------------------------------------------------------
-        memory_refs = []
-        allowed_recall = []
-
-        if self.enable_msp and self.msp is not None and user_context is not None:
-            # TODO: Implement MSP query based on user_context
-            # TODO: Write episode if needed
-            pass
-
-        # -------------------------------------------------------------------------
-        # 8. Build Tool Result
-        # -------------------------------------------------------------------------
-        from datetime import datetime, timezone
-
-        result = EVAToolResult(
+        return EVAToolResult(
             emotion_state=eva_state,
-            pulse_snapshot={
-                "pulse_id": pulse_snapshot.pulse_id,
-                "pulse_mode": pulse_snapshot.pulse_mode,
-                "arousal_level": pulse_snapshot.arousal_level,
-                "valence_level": pulse_snapshot.valence_level,
-                "cognitive_mode": pulse_snapshot.cognitive_mode,
-                "pacing": pulse_snapshot.pacing,
-                "llm_prompt_flags": pulse_snapshot.llm_prompt_flags,
-                "safety_actions": pulse_snapshot.safety_actions,
-                "debug_tags": pulse_snapshot.debug_tags
-            },
+            pulse_snapshot=pulse_snapshot,
             reflex_directives=reflex_vector,
             qualia_snapshot={
                 "intensity": qualia.intensity,
@@ -324,20 +521,12 @@ class EVATool:
                 "intensity": rms_output.intensity,
                 "trauma_flag": rms_output.trauma_flag
             },
-            memory_refs=memory_refs,
-            allowed_recall=allowed_recall,
-            ess_id=self.ess_id or "no_session",
-            timestamp=datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            memory_refs=[],
+            allowed_recall=[],
+            ess_id="baseline",
+            timestamp=""
         )
 
-        print(f"[EVATool] Processing complete")
-        print(f"  Pulse Mode: {pulse_snapshot.pulse_mode}")
-        print(f"  Arousal: {pulse_snapshot.arousal_level:.3f}")
-        print(f"  Threat Level: {reflex_vector.get('threat_level', 0):.3f}")
-        print(f"  Trauma Flag: {rms_output.trauma_flag}")
-
-        return result
-
 
     def end_session(self):
         """
@@ -363,6 +552,10 @@ class EVATool:
 # =============================================================================
 
 if __name__ == "__main__":
+    # INFO as in production, plus the EVA per-tick diagnostics
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("eva").setLevel(logging.DEBUG)
+
     print("="*80)
     print("EVA TOOL TEST")
     print("="*80)
@@ -5,11 +5,51 @@
 # =============================================================================
 
 import os
+import threading
+from typing import Dict, Iterator, List, Optional
+
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+# Names of models supporting generateContent, fetched once per process
+_MODELS_CACHE: Optional[List[str]] = None
+_MODELS_LOCK = threading.Lock()
+
+
+def _available_models() -> List[str]:
+    global _MODELS_CACHE
+    with _MODELS_LOCK:
+        if _MODELS_CACHE is None:
+            _MODELS_CACHE = [
+                m.name for m in genai.list_models()
+                if 'generateContent' in m.supported_generation_methods
+            ]
+        return _MODELS_CACHE
+
+
+# Configured models shared by every bridge (GenerativeModel holds no
+# per-request state), by model name. genai.configure is process-wide:
+# it only runs when the API key changes, and then drops the cached models
+_MODEL_CACHE: Dict[str, "genai.GenerativeModel"] = {}
+_CONFIGURED_KEY: Optional[str] = None
+_MODEL_LOCK = threading.Lock()
+
+
+def _shared_model(api_key: str, model_name: str) -> "genai.GenerativeModel":
+    global _CONFIGURED_KEY
+    with _MODEL_LOCK:
+        if _CONFIGURED_KEY != api_key:
+            genai.configure(api_key=api_key)
+            _CONFIGURED_KEY = api_key
+            _MODEL_CACHE.clear()
+        model = _MODEL_CACHE.get(model_name)
+        if model is None:
+            model = _MODEL_CACHE[model_name] = genai.GenerativeModel(model_name)
+        return model
+
+
 class LLMBridge:
-    def __init__(self, model_name="gemini-2.0-flash"): # Updated to valid available model
+    def __init__(self, model_name="gemini-2.0-flash", debug=False): # Updated to valid available model
         # 1. Load Config
         load_dotenv() # Looks for .env
         self.api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -18,18 +58,18 @@ class LLMBridge:
             print("[LLM-Bridge] CRITICAL: No API Key found in env!")
             self.client_ready = False
         else:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(model_name)
+            self.model = _shared_model(self.api_key, model_name)
             self.client_ready = True
             
-            # Debug: List available models
-            try:
-                print("[LLM-Bridge] Checking available models...")
-                for m in genai.list_models():
-                    if 'generateContent' in m.supported_generation_methods:
-                        print(f" - {m.name}")
-            except Exception as e:
-                print(f"[LLM-Bridge] List Models Failed: {e}")
+            # Debug: List available models (a blocking API round trip, so
+            # only on request, and only once per process)
+            if debug:
+                try:
+                    print("[LLM-Bridge] Checking available models...")
+                    for name in _available_models():
+                        print(f" - {name}")
+                except Exception as e:
+                    print(f"[LLM-Bridge] List Models Failed: {e}")
 
             print(f"[LLM-Bridge] Configured for: {model_name}")
 
@@ -46,19 +86,45 @@ class LLMBridge:
         try:
             # Simple generation for now
             # Can be enhanced with chat history or system instruction handling
-            final_prompt = prompt
-            if system_instruction:
-                final_prompt = f"System Instruction:\n{system_instruction}\n\nUser Input:\n{prompt}"
-                
-            response = self.model.generate_content(final_prompt)
+            response = self.model.generate_content(self._final_prompt(prompt, system_instruction))
             return response.text
 
         except Exception as e:
             print(f"[LLM-Bridge] API Error: {e}")
             return f"[SYSTEM_ERROR] LLM Generation Failed: {str(e)}"
 
+    def generate_stream(self, prompt, system_instruction=None) -> Iterator[str]:
+        """
+        Generates content from Gemini, yielding text chunks as they arrive.
+        Args:
+            prompt (str): The combined user+context prompt.
+            system_instruction (str): Optional system prompt (if model supports it).
+        Errors are yielded as a final [SYSTEM_ERROR] chunk, like generate().
+        """
+        if not self.client_ready:
+            yield "[SYSTEM_ERROR] LLM Bridge not configured (Missing API Key)."
+            return
+
+        try:
+            response = self.model.generate_content(
+                self._final_prompt(prompt, system_instruction), stream=True
+            )
+            for chunk in response:
+                yield chunk.text
+
+        except Exception as e:
+            print(f"[LLM-Bridge] API Error: {e}")
+            yield f"[SYSTEM_ERROR] LLM Generation Failed: {str(e)}"
+
+    @staticmethod
+    def _final_prompt(prompt, system_instruction):
+        # System instruction is prepended to the prompt text
+        if system_instruction:
+            return f"System Instruction:\n{system_instruction}\n\nUser Input:\n{prompt}"
+        return prompt
+
 # Test Block
 if __name__ == "__main__":
-    bridge = LLMBridge()
+    bridge = LLMBridge(debug=True)
     if bridge.client_ready:
         print(bridge.generate("Hello EVA, are you online?"))
@@ -21,12 +21,28 @@
 # =============================================================================
 
 import sys
+import copy
 import json
+import hashlib
+import logging
+import string
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from datetime import datetime, timezone
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Per-turn diagnostics (debug level; silent under a production INFO config)
+log = logging.getLogger("eva.orchestrator")
+
 # Add component paths
 base_path = Path(__file__).parent.parent
 sys.path.append(str(base_path / "Orchestrator"))
@@ -78,6 +94,9 @@ Call EVA Tool when:
 - Emotional state needs tracking
 """
 
+# Second half of every Phase 1 cache key (the instruction is a constant)
+_PHASE1_INSTRUCTION_DIGEST = hashlib.blake2b(PHASE1_SYSTEM_INSTRUCTION.encode("utf-8"), digest_size=16).digest()
+
 PHASE2_SYSTEM_TEMPLATE = """You are EVA 7.0, an Informational Organism.
 
 ## Current State (from EVA Tool):
@@ -118,14 +137,50 @@ Check-in Needed: {check_in_needed}
 Now generate your response to the user, shaped by these constraints.
 """
 
+# PHASE2_SYSTEM_TEMPLATE parsed once into (literal, field, spec, conversion)
+# parts; _render_phase2 fills them without re-tokenizing the template per turn
+_PHASE2_PARTS = list(string.Formatter().parse(PHASE2_SYSTEM_TEMPLATE))
+_CONVERSIONS = {None: lambda v: v, "r": repr, "s": str, "a": ascii}
+
+
+def _render_phase2(ns: Dict[str, Any]) -> str:
+    """Same text as PHASE2_SYSTEM_TEMPLATE.format_map(ns)"""
+    return "".join([
+        literal + (format(_CONVERSIONS[conversion](ns[field]), spec) if field is not None else "")
+        for literal, field, spec, conversion in _PHASE2_PARTS
+    ])
+
+
+@lru_cache(maxsize=256)
+def _safety_json(items: Tuple[Tuple[str, bool], ...]) -> str:
+    return json.dumps(dict(items), indent=2)
+
+
+def _format_safety(safety: Dict[str, Any]) -> str:
+    """json.dumps(safety, indent=2), memoized for the Dict[str, bool] contract"""
+    # With str keys and bool values, equal tuples always give equal JSON
+    # (not so for 1 vs True), and there are only 2^n distinct texts
+    if isinstance(safety, dict):
+        items = tuple(safety.items())
+        if all(type(k) is str and type(v) is bool for k, v in items):
+            return _safety_json(items)
+    return json.dumps(safety, indent=2)
+
+
+# Phase 2 without EVA Tool results (depends on the user input only)
+PHASE2_SIMPLE_SYSTEM_INSTRUCTION = """You are EVA 7.0. Respond naturally to the user's message."""
+
 
 # =============================================================================
 # Data Contracts
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class Phase1Output:
     """Output from Phase 1: Cognitive Scan"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("intent", "stimulus_vector", "emotion_detected", "call_eva_tool", "reasoning", "raw_response")
+
     intent: str
     stimulus_vector: Dict[str, float]
     emotion_detected: str
@@ -134,9 +189,11 @@ class Phase1Output:
     raw_response: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class OrchestrationResult:
     """Complete orchestration result"""
+    __slots__ = ("user_input", "phase1_output", "eva_tool_result", "final_response", "metadata")
+
     user_input: str
     phase1_output: Phase1Output
     eva_tool_result: Optional[EVAToolResult]
@@ -160,7 +217,9 @@ class TwoPhaseOrchestrator:
         base_path: Path = None,
         llm_model: str = "gemini-2.0-flash-exp",
         enable_msp: bool = False,
-        validation_mode: str = "warn"
+        validation_mode: str = "warn",
+        speculative_phase2: bool = True,
+        phase1_cache_size: int = 1024
     ):
         """
         Initialize Two-Phase Orchestrator
@@ -170,6 +229,11 @@ class TwoPhaseOrchestrator:
             llm_model: Gemini model name
             enable_msp: Enable MSP memory operations
             validation_mode: MSP validation mode
+            speculative_phase2: Run the no-tool Phase 2 call alongside Phase 1
+                (one RTT on no-tool turns; the speculative call is wasted
+                when Phase 1 calls the EVA Tool)
+            phase1_cache_size: Parsed Phase 1 outputs kept per normalized
+                input (LRU; 0 disables the cache)
         """
         print("[Orchestrator] Initializing Two-Phase Orchestrator...")
 
@@ -183,6 +247,15 @@ class TwoPhaseOrchestrator:
         if not self.llm.client_ready:
             raise RuntimeError("LLM Bridge initialization failed - check API key")
 
+        # Speculative no-tool Phase 2 runs on this worker during Phase 1
+        self.speculative_phase2 = speculative_phase2
+        self._speculation_pool = ThreadPoolExecutor(max_workers=1) if speculative_phase2 else None
+
+        # Phase 1 is a function of the input and PHASE1_SYSTEM_INSTRUCTION:
+        # parsed outputs are reused for repeated inputs ("hello", "thanks")
+        self._phase1_cache: "OrderedDict[Tuple[bytes, bytes], Phase1Output]" = OrderedDict()
+        self._phase1_cache_size = phase1_cache_size
+
         # Initialize EVA Tool
         self.eva_tool = EVATool(
             msp_base_path=base_path,
@@ -223,7 +296,8 @@ class TwoPhaseOrchestrator:
         self,
         user_input: str,
         user_context: Dict[str, Any] = None,
-        force_eva_tool: bool = False
+        force_eva_tool: bool = False,
+        bypass_cache: bool = False
     ) -> OrchestrationResult:
         """
         Process user input through two-phase pipeline
@@ -232,88 +306,193 @@ class TwoPhaseOrchestrator:
             user_input: User's message
             user_context: Optional user context from CIN
             force_eva_tool: Force EVA Tool call regardless of Phase 1 decision
+            bypass_cache: Always call the LLM for Phase 1 (eval runs)
 
         Returns:
             OrchestrationResult with complete output
         """
-        self.episode_count += 1
-        print(f"\n{'='*80}")
-        print(f"PROCESSING EPISODE {self.episode_count}")
-        print(f"{'='*80}")
-        print(f"User: {user_input}\n")
+        phase1_output, eva_tool_result, timestamp, speculative_response, phase2_prompt, phase2_system = (
+            self._begin_turn(user_input, user_context, force_eva_tool, bypass_cache)
+        )
 
-        # -------------------------------------------------------------------------
-        # PHASE 1: COGNITIVE SCAN
-        # -------------------------------------------------------------------------
-        print("[Phase 1] Cognitive Scan...")
+        if speculative_response is not None:
+            final_response = speculative_response.result()
+        else:
+            final_response = self.llm.generate(
+                prompt=phase2_prompt,
+                system_instruction=phase2_system
+            )
 
-        phase1_prompt = f"""User Input: {user_input}
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[Phase 2] Complete")
 
-Analyze this input and provide your assessment as JSON."""
+        return self._build_result(user_input, phase1_output, eva_tool_result, final_response, timestamp)
 
-        phase1_response = self.llm.generate(
-            prompt=phase1_prompt,
-            system_instruction=PHASE1_SYSTEM_INSTRUCTION
-        )
 
-        print(f"[Phase 1] LLM Response:\n{phase1_response}\n")
+    def process_stream(
+        self,
+        user_input: str,
+        user_context: Dict[str, Any] = None,
+        force_eva_tool: bool = False,
+        bypass_cache: bool = False
+    ) -> Iterator[str]:
+        """
+        Process user input, streaming the Phase 2 response
 
-        # Parse Phase 1 output
-        try:
-            phase1_json = self._extract_json(phase1_response)
-            phase1_output = Phase1Output(
-                intent=phase1_json.get("intent", "unknown"),
-                stimulus_vector=phase1_json.get("stimulus_vector", {}),
-                emotion_detected=phase1_json.get("emotion_detected", "neutral"),
-                call_eva_tool=phase1_json.get("call_eva_tool", False) or force_eva_tool,
-                reasoning=phase1_json.get("reasoning", ""),
-                raw_response=phase1_response
+        Same pipeline as process(): Phase 1 and the EVA Tool still block
+        (Phase 2 needs their output), then the Phase 2 text is yielded
+        chunk by chunk as the LLM produces it. A speculative no-tool
+        response (already requested during Phase 1) is yielded whole.
+
+        Args:
+            user_input: User's message
+            user_context: Optional user context from CIN
+            force_eva_tool: Force EVA Tool call regardless of Phase 1 decision
+            bypass_cache: Always call the LLM for Phase 1 (eval runs)
+
+        Returns:
+            Generator of response text chunks; its return value (e.g.
+            result = yield from orchestrator.process_stream(...)) is the
+            OrchestrationResult with the joined response
+        """
+        phase1_output, eva_tool_result, timestamp, speculative_response, phase2_prompt, phase2_system = (
+            self._begin_turn(user_input, user_context, force_eva_tool, bypass_cache)
+        )
+
+        if speculative_response is not None:
+            chunks = (speculative_response.result(),)
+        else:
+            chunks = self.llm.generate_stream(
+                prompt=phase2_prompt,
+                system_instruction=phase2_system
             )
-        except Exception as e:
-            print(f"[Phase 1] WARNING: Failed to parse JSON: {e}")
-            # Fallback
-            phase1_output = Phase1Output(
-                intent="unknown",
-                stimulus_vector={"neutral": 0.5},
-                emotion_detected="neutral",
-                call_eva_tool=force_eva_tool,
-                reasoning="Parse error - using fallback",
-                raw_response=phase1_response
+
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[Phase 2] Complete")
+
+        return self._build_result(user_input, phase1_output, eva_tool_result, "".join(parts), timestamp)
+
+
+    def _begin_turn(
+        self,
+        user_input: str,
+        user_context: Optional[Dict[str, Any]],
+        force_eva_tool: bool,
+        bypass_cache: bool
+    ) -> Tuple[Phase1Output, Optional[EVAToolResult], str, Optional[Future], Optional[str], Optional[str]]:
+        """
+        Run a turn up to the Phase 2 LLM call
+
+        Returns:
+            (phase1_output, eva_tool_result, timestamp, speculative_response,
+             phase2_prompt, phase2_system); speculative_response is set
+            when it is the Phase 2 response, the prompt pair otherwise
+        """
+        self.episode_count += 1
+
+        # One timestamp for the whole turn (EVA Tool result and metadata)
+        timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("%s\nPROCESSING EPISODE %d\n%s", "=" * 80, self.episode_count, "=" * 80)
+            log.debug("User: %s", user_input)
+
+        # -------------------------------------------------------------------------
+        # PHASE 1: COGNITIVE SCAN
+        # -------------------------------------------------------------------------
+        if debug:
+            log.debug("[Phase 1] Cognitive Scan...")
+
+        cache_key = None
+        cached = None
+        if self._phase1_cache_size > 0 and not bypass_cache:
+            cache_key = self._phase1_cache_key(user_input)
+            cached = self._phase1_cache.get(cache_key)
+
+        # The no-tool Phase 2 prompt depends on the user input only: on a
+        # cache miss, start it now so it overlaps the Phase 1 call, and use it
+        # if Phase 1 skips the EVA Tool. A hit already knows the decision.
+        speculative_response = None
+        if cached is None and self.speculative_phase2 and not force_eva_tool:
+            speculative_response = self._speculation_pool.submit(
+                self.llm.generate,
+                prompt=f"User: {user_input}",
+                system_instruction=PHASE2_SIMPLE_SYSTEM_INSTRUCTION
             )
 
+        if cached is not None:
+            self._phase1_cache.move_to_end(cache_key)
+            if debug:
+                log.debug("[Phase 1] Cache hit (skipping LLM call)")
+            # Per-turn copy: the cached entry itself is never handed out
+            phase1_output = replace(cached, stimulus_vector=copy.copy(cached.stimulus_vector))
+        else:
+            phase1_output, parsed = self._run_phase1(user_input)
+            # Parse fallbacks are not cached (the next turn retries the LLM)
+            if parsed and cache_key is not None:
+                self._phase1_cache[cache_key] = replace(
+                    phase1_output, stimulus_vector=copy.copy(phase1_output.stimulus_vector)
+                )
+                while len(self._phase1_cache) > self._phase1_cache_size:
+                    self._phase1_cache.popitem(last=False)
+
+        # Applied per turn, so cached outputs stay independent of it
+        if force_eva_tool and not phase1_output.call_eva_tool:
+            phase1_output = replace(phase1_output, call_eva_tool=True)
+
         # -------------------------------------------------------------------------
         # EVA TOOL CALL (if needed)
         # -------------------------------------------------------------------------
         eva_tool_result = None
 
         if phase1_output.call_eva_tool:
-            print("[EVA Tool] Calling deterministic pipeline...")
+            if debug:
+                log.debug("[EVA Tool] Calling deterministic pipeline...")
 
             eva_tool_result = self.eva_tool.process(
                 stimulus_vector=phase1_output.stimulus_vector,
                 user_context=user_context,
-                delta_t_ms=33
+                delta_t_ms=33,
+                timestamp=timestamp
             )
 
-            print(f"[EVA Tool] Complete")
-            print(f"  Pulse: {eva_tool_result.pulse_snapshot['pulse_mode']}")
-            print(f"  Arousal: {eva_tool_result.pulse_snapshot['arousal_level']:.2f}")
-            print(f"  Threat: {eva_tool_result.reflex_directives.get('threat_level', 0):.2f}\n")
+            if debug:
+                log.debug(
+                    "[EVA Tool] Complete\n  Pulse: %s\n  Arousal: %.2f\n  Threat: %.2f",
+                    eva_tool_result.pulse_snapshot['pulse_mode'],
+                    eva_tool_result.pulse_snapshot['arousal_level'],
+                    eva_tool_result.reflex_directives.get('threat_level', 0)
+                )
 
         # -------------------------------------------------------------------------
         # PHASE 2: RESPONSE SHAPING
         # -------------------------------------------------------------------------
-        print("[Phase 2] Response Shaping...")
+        if debug:
+            log.debug("[Phase 2] Response Shaping...")
 
         if eva_tool_result:
-            # Build Phase 2 prompt with tool results
+            # State-conditioned response needed: drop the speculative one
+            # (cancel() only stops it if it has not started yet)
+            if speculative_response is not None:
+                speculative_response.cancel()
+
+            # Build Phase 2 prompt with tool results. Built inline: the
+            # render is a few microseconds on the precompiled template, less
+            # than a thread handoff, and everything but the constant parts
+            # (already in _PHASE2_PARTS) depends on the tool result
             pulse = eva_tool_result.pulse_snapshot
             reflex = eva_tool_result.reflex_directives
             flags = pulse['llm_prompt_flags']
             pacing = pulse['pacing']
             safety = pulse['safety_actions']
 
-            phase2_system = PHASE2_SYSTEM_TEMPLATE.format(
+            phase2_system = _render_phase2(dict(
                 pulse_mode=pulse['pulse_mode'],
                 arousal=pulse['arousal_level'],
                 valence=pulse['valence_level'],
@@ -328,10 +507,10 @@ Analyze this input and provide your assessment as JSON."""
                 playfulness=flags['playfulness'],
                 formality=flags['formality'],
                 meta_level=flags['meta_level'],
-                safety_actions=json.dumps(safety, indent=2),
+                safety_actions=_format_safety(safety),
                 response_length=pacing['response_length'],
                 check_in_needed=pacing['check_in_needed']
-            )
+            ))
 
             phase2_prompt = f"""User said: {user_input}
 
@@ -340,25 +519,27 @@ Emotion detected: {phase1_output.emotion_detected}
 
 Now respond to the user, applying the constraints from your current state."""
 
-            final_response = self.llm.generate(
-                prompt=phase2_prompt,
-                system_instruction=phase2_system
-            )
+            return phase1_output, eva_tool_result, timestamp, None, phase2_prompt, phase2_system
 
-        else:
-            # No EVA Tool - simple response
-            simple_system = """You are EVA 7.0. Respond naturally to the user's message."""
-            final_response = self.llm.generate(
-                prompt=f"User: {user_input}",
-                system_instruction=simple_system
-            )
+        # No EVA Tool - simple response
+        if speculative_response is not None:
+            return phase1_output, eva_tool_result, timestamp, speculative_response, None, None
+        return (
+            phase1_output, eva_tool_result, timestamp, None,
+            f"User: {user_input}", PHASE2_SIMPLE_SYSTEM_INSTRUCTION
+        )
 
-        print(f"[Phase 2] Complete\n")
 
-        # -------------------------------------------------------------------------
-        # Build Result
-        # -------------------------------------------------------------------------
-        result = OrchestrationResult(
+    def _build_result(
+        self,
+        user_input: str,
+        phase1_output: Phase1Output,
+        eva_tool_result: Optional[EVAToolResult],
+        final_response: str,
+        timestamp: str
+    ) -> OrchestrationResult:
+        """Package a finished turn"""
+        return OrchestrationResult(
             user_input=user_input,
             phase1_output=phase1_output,
             eva_tool_result=eva_tool_result,
@@ -366,13 +547,11 @@ Now respond to the user, applying the constraints from your current state."""
             metadata={
                 "session_id": self.session_id,
                 "episode_count": self.episode_count,
-                "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+                "timestamp": timestamp,
                 "eva_tool_called": eva_tool_result is not None
             }
         )
 
-        return result
-
 
     def end_session(self):
         """End orchestration session"""
@@ -382,6 +561,59 @@ Now respond to the user, applying the constraints from your current state."""
             print(f"  Total episodes: {self.episode_count}")
 
 
+    def _run_phase1(self, user_input: str) -> Tuple[Phase1Output, bool]:
+        """
+        Run the Phase 1 LLM call and parse its output
+
+        Args:
+            user_input: User's message
+
+        Returns:
+            (Phase1Output without force_eva_tool applied, parsed); parsed is
+            False when the response was not valid JSON and the fallback is used
+        """
+        phase1_prompt = f"""User Input: {user_input}
+
+Analyze this input and provide your assessment as JSON."""
+
+        phase1_response = self.llm.generate(
+            prompt=phase1_prompt,
+            system_instruction=PHASE1_SYSTEM_INSTRUCTION
+        )
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[Phase 1] LLM Response:\n%s", phase1_response)
+
+        # Parse Phase 1 output
+        try:
+            phase1_json = self._extract_json(phase1_response)
+            return Phase1Output(
+                intent=phase1_json.get("intent", "unknown"),
+                stimulus_vector=phase1_json.get("stimulus_vector", {}),
+                emotion_detected=phase1_json.get("emotion_detected", "neutral"),
+                call_eva_tool=phase1_json.get("call_eva_tool", False),
+                reasoning=phase1_json.get("reasoning", ""),
+                raw_response=phase1_response
+            ), True
+        except Exception as e:
+            log.warning("[Phase 1] Failed to parse JSON: %s", e)
+            # Fallback
+            return Phase1Output(
+                intent="unknown",
+                stimulus_vector={"neutral": 0.5},
+                emotion_detected="neutral",
+                call_eva_tool=False,
+                reasoning="Parse error - using fallback",
+                raw_response=phase1_response
+            ), False
+
+    def _phase1_cache_key(self, user_input: str) -> Tuple[bytes, bytes]:
+        """Cache key: digests of the normalized input and of the Phase 1 instruction"""
+        return (
+            hashlib.blake2b(user_input.strip().lower().encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            _PHASE1_INSTRUCTION_DIGEST
+        )
+
     def _extract_json(self, text: str) -> Dict[str, Any]:
         """
         Extract JSON from LLM response
@@ -406,6 +638,14 @@ Now respond to the user, applying the constraints from your current state."""
             else:
                 json_text = text
 
+        # orjson parses the slab in C; anything it rejects (NaN, Infinity)
+        # gets the stdlib parser and its error. Integers beyond 64 bits come
+        # back as floats, which is fine for Phase 1 scores and flags.
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(json_text)
+            except orjson.JSONDecodeError:
+                pass
         return json.loads(json_text)
 
 
@@ -414,6 +654,10 @@ Now respond to the user, applying the constraints from your current state."""
 # =============================================================================
 
 if __name__ == "__main__":
+    # INFO as in production, plus the EVA per-turn diagnostics
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("eva").setLevel(logging.DEBUG)
+
     print("="*80)
     print("TWO-PHASE ORCHESTRATOR TEST")
     print("="*80)
@@ -16,9 +16,14 @@ from dataclasses import dataclass
 from typing import Literal, Dict
 import math
 
+import numpy as np
+
 
 PulseState = Literal["stable", "slightly_delayed", "unstable_lag", "overdrive", "unknown"]
 
+# pulse_state ตามจำนวนเกณฑ์ที่ผ่าน (>= 500, > 1500, > 4000) สำหรับ batch
+_BATCH_STATES = np.array(["overdrive", "stable", "slightly_delayed", "unstable_lag"], dtype=object)
+
 
 @dataclass
 class PulseResult:
@@ -44,16 +49,19 @@ def _classify_pulse_state(latency_ms: float) -> PulseState:
       - Baseline Target: 1200ms (ค่าเฉลี่ยในอุดมคติ)
       - Max Tolerable Delay: 4000ms
     """
+    # Each check only runs once the previous one failed, so its lower bound
+    # is already known (one comparison per band; NaN fails them all)
+
     # 1. Overdrive/Too Fast (เสี่ยงต่อการประมวลผลไม่สมบูรณ์)
     if latency_ms < 500.0:
         return "overdrive"
         
-    # 2. Stable (อยู่ในช่วงปกติ, ประมวลผลได้ราบรื่น)
-    if 500.0 <= latency_ms <= 1500.0:
+    # 2. Stable (อยู่ในช่วงปกติ, ประมวลผลได้ราบรื่น) 500-1500ms
+    if latency_ms <= 1500.0:
         return "stable"
         
-    # 3. Slightly Delayed (เริ่มมีภาระงานสูงหรือความต่อเนื่องเริ่มลด)
-    if 1500.0 < latency_ms <= 4000.0:
+    # 3. Slightly Delayed (เริ่มมีภาระงานสูงหรือความต่อเนื่องเริ่มลด) 1500-4000ms
+    if latency_ms <= 4000.0:
         return "slightly_delayed"
         
     # 4. Unstable (ล่าช้าเกินไป, สัญญาณความไม่เสถียรของ Temporal)
@@ -101,4 +109,40 @@ def compute_pulse_drift(
         "pulse_state": pulse_state,
         "latency_ms": round(latency_ms, 2),
         "latency_vs_max_percent": round(latency_vs_max_percent, 2), # เพิ่ม field นี้เพื่อความสมบูรณ์
-    }
\ No newline at end of file
+    }
+
+
+def compute_pulse_drift_batch(
+    timestamps_prev,
+    timestamps_now,
+) -> Dict[str, np.ndarray]:
+    """
+    entry แบบ batch: คำนวณ Temporal metrics ของหลาย turn พร้อมกัน
+    (เช่นตอน replay Memory_Log.json) ด้วย NumPy ufunc ทั้ง array
+
+    ค่าต่อ element เท่ากับ compute_pulse_drift (ปัดทศนิยมด้วย np.round)
+    คืน dict ที่มี key เดียวกัน แต่ละ key เป็น array ยาว N
+    """
+    prev = np.asarray(timestamps_prev, dtype=np.float64)
+    now = np.asarray(timestamps_now, dtype=np.float64)
+
+    # max(0.0, dt) ของ scalar: ค่าที่ไม่มากกว่า 0 (รวม NaN) กลายเป็น 0.0
+    dt_ms = (now - prev) * 1000.0
+    latency_ms = np.where(dt_ms > 0.0, dt_ms, 0.0)
+
+    # เกณฑ์เดียวกับ _classify_pulse_state (500 รวมขอบล่าง, 1500/4000 รวมขอบบน)
+    band = (latency_ms >= 500.0).astype(np.intp)
+    band += latency_ms > 1500.0
+    band += latency_ms > 4000.0
+    pulse_state = _BATCH_STATES[band]
+
+    # _compute_drift_score (baseline 1200ms) และ latency_vs_max_percent (max 5000ms)
+    drift_score = np.clip(np.abs(latency_ms - 1200.0) / 5000.0, 0.0, 1.0)
+    latency_vs_max_percent = np.clip((latency_ms / 5000.0) * 100.0, 0.0, 100.0)
+
+    return {
+        "drift_score": np.round(drift_score, 4),
+        "pulse_state": pulse_state,
+        "latency_ms": np.round(latency_ms, 2),
+        "latency_vs_max_percent": np.round(latency_vs_max_percent, 2),
+    }
@@ -8,11 +8,61 @@ Logic:
 - Produces PulseSnapshot (mode, arousal, pacing, prompt_flags).
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import time
 import json
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+SOT_SCHEMA_VERSION = "sot-1.0"
+
+
+def _sot_line(obj) -> bytes:
+    # One JSON Lines record as UTF-8 bytes. orjson serializes dataclasses
+    # natively (no asdict() deep copy); the stdlib path converts them first
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson.JSONEncodeError (non-str keys, unsupported types)
+            pass
+    if not isinstance(obj, dict):
+        obj = asdict(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+# (epoch second, formatted timestamp): snapshots within one second share
+# the string. Rebound as one tuple, so concurrent readers see a matching pair
+_ISO_NOW = (-1, "")
+
+
+def _iso_now() -> str:
+    """Current UTC time as %Y-%m-%dT%H:%M:%SZ, formatted once per second"""
+    global _ISO_NOW
+    now = int(time.time())
+    cached = _ISO_NOW
+    if cached[0] == now:
+        return cached[1]
+    text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    _ISO_NOW = (now, text)
+    return text
+
+
+# Not slotted: dataclass(slots=True) needs Python 3.10, and a hand-written
+# __slots__ cannot coexist with the field defaults below
 @dataclass
 class PulseSnapshot:
     pulse_id: str
@@ -24,7 +74,133 @@ class PulseSnapshot:
     llm_prompt_flags: Dict[str, float]
     safety_actions: Dict[str, bool]
     debug_tags: List[str] = field(default_factory=list)
-    timestamp: str = field(default_factory=lambda: time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+    timestamp: str = field(default_factory=_iso_now)
+
+    def __getitem__(self, key: str) -> Any:
+        # Read-only mapping access (snapshot["pulse_mode"]) for dict-style consumers
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+def _pulse_vector(adrenaline, noradrenaline, cortisol, serotonin, oxytocin, endorphin,
+                  ri_l1, ri_l2, ri_l4, existential_signal, exist_clarity,
+                  intimacy, resonance, rz_active) -> Tuple[float, float, float, float, float]:
+    """
+    Internal pulse vector: (arousal, valence, cog_pressure, existential_load,
+    relational_focus), each clamped to [0, 1].
+    """
+    # Arousal: w1*AD + w2*NA + w3*CT + 0.2*RI_L1
+    arousal_base = (0.4 * adrenaline) + (0.3 * noradrenaline) + (0.3 * cortisol)
+    arousal = min(1.0, max(0.0, arousal_base + (0.2 * ri_l1)))
+
+    # Valence: 0.4*5HT + 0.3*OX + 0.2*EN - 0.3*CT
+    valence = min(1.0, max(0.0, (0.4 * serotonin) + (0.3 * oxytocin) + (0.2 * endorphin) - (0.3 * cortisol)))
+
+    # Cognitive Pressure: 0.5*RI_L4 + 0.3*RI_L2 + 0.2*NA
+    cog_pressure = min(1.0, max(0.0, (0.5 * ri_l4) + (0.3 * ri_l2) + (0.2 * noradrenaline)))
+
+    # Existential Load
+    existential_load = min(1.0, max(0.0, (0.7 * existential_signal) + (0.3 * exist_clarity)))
+    if rz_active:
+        existential_load = max(existential_load, 0.8)
+
+    # Relational Focus
+    relational_focus = min(1.0, max(0.0, (0.5 * oxytocin) + (0.3 * intimacy) + (0.2 * resonance)))
+
+    return arousal, valence, cog_pressure, existential_load, relational_focus
+
+
+if NUMBA_AVAILABLE:
+    # Compiled once to the on-disk cache. No fastmath: reassociation / FMA
+    # contraction would change the scores the mode thresholds compare
+    _pulse_vector = njit(cache=True)(_pulse_vector)
+
+
+def _pulse_inputs(c_mod: Dict[str, float],
+                  ri_data: Dict[str, Any],
+                  eva_ri_input: Dict[str, Any]) -> Tuple:
+    """
+    _pulse_vector arguments for one turn, extracted from the compute_pulse
+    inputs.
+    """
+    ri_l5 = ri_data.get("RI_L5", {})
+    rz_state = ri_data.get("RZ_state", {"RZ_active": False})
+
+    exist_clarity = 0.0
+    intimacy = 0.0
+    resonance = 0.0
+    if isinstance(ri_l5, Mapping):
+        exist_clarity = ri_l5.get("S9_existential_clarity", 0.0)
+        intimacy = ri_l5.get("O5_intimacy", 0.0)
+        resonance = ri_l5.get("O3_empathic_resonance", 0.0)
+
+    # Hormones are normalized values from ESS C_Mod (DA/GABA/GLU are not in
+    # the scoring formulas), then the RI metrics
+    return (
+        c_mod.get("AD", 0.0), c_mod.get("NA", 0.0), c_mod.get("CT", 0.0),
+        c_mod.get("5HT", 0.0), c_mod.get("OX", 0.0), c_mod.get("EN", 0.0),
+        ri_data.get("RI_L1", 0.0), ri_data.get("RI_L2", 0.0), ri_data.get("RI_L4", 0.0),
+        eva_ri_input.get("existential_signal", 0.0), exist_clarity,
+        intimacy, resonance, bool(rz_state.get("RZ_active"))
+    )
+
+
+def _clamp01(x: np.ndarray) -> np.ndarray:
+    # min(1.0, max(0.0, x)) elementwise, NaN → 0.0 like the scalar form
+    x = np.where(x > 0.0, x, 0.0)
+    return np.where(x < 1.0, x, 1.0)
+
+
+def compute_pulse_vectors(c_mods: List[Dict[str, float]],
+                          ri_data: List[Dict[str, Any]],
+                          eva_ri_inputs: Optional[List[Dict[str, Any]]] = None) -> Dict[str, np.ndarray]:
+    """
+    Internal pulse vectors for N turns at once (e.g. replaying a session).
+
+    Takes per-turn lists of the compute_pulse inputs and returns arrays of
+    length N for arousal, valence, cog_pressure, existential_load and
+    relational_focus, equal to compute_pulse's values turn by turn (each
+    formula is evaluated column-wise in the scalar operation order).
+
+    Raises:
+        ValueError: if the per-turn lists differ in length
+    """
+    if eva_ri_inputs is None:
+        eva_ri_inputs = [{}] * len(c_mods)
+    if not len(c_mods) == len(ri_data) == len(eva_ri_inputs):
+        raise ValueError(
+            f"compute_pulse_vectors needs one entry per turn in each list, got "
+            f"{len(c_mods)} c_mods, {len(ri_data)} ri_data, {len(eva_ri_inputs)} eva_ri_inputs"
+        )
+
+    rows = np.array(
+        [_pulse_inputs(c, r, e or {}) for c, r, e in zip(c_mods, ri_data, eva_ri_inputs)],
+        dtype=np.float64
+    ).reshape(-1, 14)
+    (adrenaline, noradrenaline, cortisol, serotonin, oxytocin, endorphin,
+     ri_l1, ri_l2, ri_l4, existential_signal, exist_clarity,
+     intimacy, resonance, rz_active) = rows.T
+
+    arousal_base = (0.4 * adrenaline) + (0.3 * noradrenaline) + (0.3 * cortisol)
+    arousal = _clamp01(arousal_base + (0.2 * ri_l1))
+    valence = _clamp01((0.4 * serotonin) + (0.3 * oxytocin) + (0.2 * endorphin) - (0.3 * cortisol))
+    cog_pressure = _clamp01((0.5 * ri_l4) + (0.3 * ri_l2) + (0.2 * noradrenaline))
+
+    existential_load = _clamp01((0.7 * existential_signal) + (0.3 * exist_clarity))
+    # max(existential_load, 0.8) on RZ-active turns
+    existential_load = np.where((rz_active != 0.0) & (0.8 > existential_load), 0.8, existential_load)
+
+    relational_focus = _clamp01((0.5 * oxytocin) + (0.3 * intimacy) + (0.2 * resonance))
+
+    return {
+        "arousal": arousal,
+        "valence": valence,
+        "cog_pressure": cog_pressure,
+        "existential_load": existential_load,
+        "relational_focus": relational_focus,
+    }
+
 
 class PulseEngineV2:
     def __init__(self):
@@ -40,64 +216,25 @@ class PulseEngineV2:
         Main entry point for calculating the turn-level pulse.
         """
         eva_ri_input = eva_ri_input or {}
-        
-        # 1. Extract Hormones (Normalized values from ESS C_Mod)
-        adrenaline = c_mod.get("AD", 0.0)
-        noradrenaline = c_mod.get("NA", 0.0)
-        cortisol = c_mod.get("CT", 0.0)
-        serotonin = c_mod.get("5HT", 0.0)
-        oxytocin = c_mod.get("OX", 0.0)
-        endorphin = c_mod.get("EN", 0.0)
-        dopamine = c_mod.get("DA", 0.0)
-        # GABA/GLU not directly in scoring formulas but useful for extensions
-        
-        # 2. Extract RI Metrics
-        ri_l1 = ri_data.get("RI_L1", 0.0)
-        ri_l2 = ri_data.get("RI_L2", 0.0)
+
+        # 1-3. Extract Hormones / RI Metrics, Calculate Internal Pulse Vector
+        arousal, valence, cog_pressure, existential_load, relational_focus = _pulse_vector(
+            *_pulse_inputs(c_mod, ri_data, eva_ri_input)
+        )
+
         ri_l3 = ri_data.get("RI_L3", 0.0)
-        ri_l4 = ri_data.get("RI_L4", 0.0)
-        ri_l5 = ri_data.get("RI_L5", {})
-        ri_global = ri_data.get("RI_global", 0.0)
         rz_state = ri_data.get("RZ_state", {"RZ_active": False})
         
-        # 3. Calculate Internal Pulse Vector
-        # Arousal: w1*AD + w2*NA + w3*CT + 0.2*RI_L1
-        arousal_base = (0.4 * adrenaline) + (0.3 * noradrenaline) + (0.3 * cortisol)
-        arousal = min(1.0, max(0.0, arousal_base + (0.2 * ri_l1)))
-        
-        # Valence: 0.4*5HT + 0.3*OX + 0.2*EN - 0.3*CT
-        valence = min(1.0, max(0.0, (0.4 * serotonin) + (0.3 * oxytocin) + (0.2 * endorphin) - (0.3 * cortisol)))
-        
-        # Cognitive Pressure: 0.5*RI_L4 + 0.3*RI_L2 + 0.2*NA
-        cog_pressure = min(1.0, max(0.0, (0.5 * ri_l4) + (0.3 * ri_l2) + (0.2 * noradrenaline)))
-        
-        # Existential Load
-        existential_signal = eva_ri_input.get("existential_signal", 0.0)
-        exist_clarity = 0.0
-        if isinstance(ri_l5, dict):
-            exist_clarity = ri_l5.get("S9_existential_clarity", 0.0)
-        
-        existential_load = min(1.0, max(0.0, (0.7 * existential_signal) + (0.3 * exist_clarity)))
-        if rz_state.get("RZ_active"):
-            existential_load = max(existential_load, 0.8)
-            
-        # Relational Focus
-        intimacy = 0.0
-        resonance = 0.0
-        if isinstance(ri_l5, dict):
-            intimacy = ri_l5.get("O5_intimacy", 0.0)
-            resonance = ri_l5.get("O3_empathic_resonance", 0.0)
-            
-        relational_focus = min(1.0, max(0.0, (0.5 * oxytocin) + (0.3 * intimacy) + (0.2 * resonance)))
-        
         # 4. Mode Determination
         safety_level = umbrella.get("safety_level", "LOW")
         rz_class = rz_state.get("RZ_class", "NORMAL")
-        
-        pulse_mode = "CALM_SUPPORT"
-        prompt_flags = {"warmth": 0.7, "directness": 0.5, "playfulness": 0.3, "formality": 0.5, "meta_level": 0.3}
-        
-        # Core Mapping Logic
+
+        # Core Mapping Logic (every branch sets pulse_mode and prompt_flags;
+        # each snapshot gets its own dicts, as they are serialized and handed
+        # to callers). The order is priority, not frequency: the predicates
+        # overlap (a DEEP_CARE turn can also meet META_REFLECTION, any turn
+        # can be an emergency), so the safety override must be tested first
+        # and CALM_SUPPORT can only be the fallback
         if safety_level in ["HIGH", "CRITICAL"] or rz_class in ["RZ-Reject", "RZ-Warning+FutureMirror"]:
             pulse_mode = "EMERGENCY_HOLD"
             prompt_flags = {"warmth": 0.9, "directness": 0.6, "playfulness": 0.0, "formality": 0.7, "meta_level": 0.9}
@@ -119,13 +256,14 @@ class PulseEngineV2:
             prompt_flags = {"warmth": 0.8, "directness": 0.4, "playfulness": 0.2, "formality": 0.4, "meta_level": 0.3}
 
         # 5. Pacing Rules
-        pacing = {"response_length": "NORMAL", "suggestion_frequency": "NORMAL", "check_in_needed": False}
         if pulse_mode == "EMERGENCY_HOLD":
             pacing = {"response_length": "SHORT", "suggestion_frequency": "HIGH", "check_in_needed": True}
         elif pulse_mode == "DEEP_CARE":
             pacing = {"response_length": "LONG", "suggestion_frequency": "NORMAL", "check_in_needed": True}
         elif pulse_mode == "FOCUSED_TASK":
             pacing = {"response_length": "NORMAL", "suggestion_frequency": "LOW", "check_in_needed": False}
+        else:
+            pacing = {"response_length": "NORMAL", "suggestion_frequency": "NORMAL", "check_in_needed": False}
 
         # 6. Safety Actions
         safety_actions = {
@@ -153,14 +291,49 @@ class PulseEngineV2:
     def save_to_sot(self, snapshot: PulseSnapshot, log_path: str):
         """
         Append the pulse snapshot to the SOT log.
+
+        The log is JSON Lines: a header line ({"schema_version": ...}) then
+        one snapshot per line, so each save is a single append. Legacy
+        whole-document .json logs are migrated with convert_json_to_jsonl().
         """
-        try:
-            with open(log_path, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            log_data = {"schema_version": "sot-1.0", "data_log": []}
-            
-        log_data["data_log"].append(asdict(snapshot))
-        
-        with open(log_path, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
+        if log_path.endswith(".json"):
+            raise ValueError(
+                f"SOT log must be JSON Lines (.jsonl), got {log_path}; "
+                "migrate it with convert_json_to_jsonl()"
+            )
+
+        with open(log_path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(_sot_line({"schema_version": SOT_SCHEMA_VERSION}))
+            f.write(_sot_line(snapshot))
+
+
+def convert_json_to_jsonl(json_path: str, jsonl_path: Optional[str] = None) -> str:
+    """
+    Migrate a whole-document SOT log ({"schema_version", ..., "data_log": [...]})
+    to JSON Lines: the top-level fields other than data_log become the header
+    line, then one line per data_log entry.
+
+    Args:
+        json_path: Legacy .json log
+        jsonl_path: Output path (default: json_path with a .jsonl suffix)
+
+    Returns:
+        Path of the written .jsonl log
+    """
+    if jsonl_path is None:
+        jsonl_path = json_path[:-len(".json")] + ".jsonl" if json_path.endswith(".json") else json_path + ".jsonl"
+
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    log_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+    header = {k: v for k, v in log_data.items() if k != "data_log"}
+    header.setdefault("schema_version", SOT_SCHEMA_VERSION)
+
+    with open(jsonl_path, 'wb') as f:
+        f.write(_sot_line(header))
+        for entry in log_data.get("data_log", []):
+            f.write(_sot_line(entry))
+
+    return jsonl_path
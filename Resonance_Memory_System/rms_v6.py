@@ -14,7 +14,7 @@
 # =============================================================================
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Tuple
 import math
 
 
@@ -23,13 +23,23 @@ import math
 # =============================================================================
 
 def clamp(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
-    return max(lo, min(hi, x))
+    # Same result as max(lo, min(hi, x)), NaN → hi and -0.0 → lo included,
+    # with plain comparisons instead of two builtin calls
+    return x if lo < x <= hi else (lo if x <= lo else hi)
 
 
 def smooth(prev: float, now: float, alpha: float = 0.7) -> float:
     return alpha * prev + (1 - alpha) * now
 
 
+# Memory color axes, in the fixed order of the internal color vectors
+COLOR_AXES = ("stress", "warmth", "clarity", "drive", "calm")
+
+# Color harmonization weights: smooth(prev, now, alpha=0.65)
+_COLOR_ALPHA = 0.65
+_COLOR_BETA = 1 - _COLOR_ALPHA
+
+
 # =============================================================================
 # Data Contracts
 # =============================================================================
@@ -51,14 +61,8 @@ class RMSEngineV6:
     """
 
     def __init__(self):
-        # Internal smoothing memory (NOT episodic memory)
-        self._last_color = {
-            "stress": 0.2,
-            "warmth": 0.5,
-            "clarity": 0.5,
-            "drive": 0.3,
-            "calm": 0.4,
-        }
+        # Internal smoothing memory (NOT episodic memory), in COLOR_AXES order
+        self._last_color = (0.2, 0.5, 0.5, 0.3, 0.4)
         self._last_intensity = 0.3
 
     # -------------------------------------------------------------------------
@@ -84,26 +88,34 @@ class RMSEngineV6:
 
         trauma_flag = self._detect_trauma(reflex_state)
 
-        color = self._generate_color(eva_matrix)
+        stress, warmth, clarity, drive, calm = self._generate_color(eva_matrix)
         intensity = self._compute_intensity(eva_matrix, rim_semantic)
 
         # Trauma de-intensification (protective)
         if trauma_flag:
-            color = {k: v * 0.45 for k, v in color.items()}
+            stress *= 0.45
+            warmth *= 0.45
+            clarity *= 0.45
+            drive *= 0.45
+            calm *= 0.45
             intensity *= 0.5
 
-        # Harmonize (smooth)
-        color = {
-            k: smooth(self._last_color[k], v, alpha=0.65)
-            for k, v in color.items()
-        }
+        # Harmonize (smooth), axis by axis in COLOR_AXES order
+        last_stress, last_warmth, last_clarity, last_drive, last_calm = self._last_color
+        color = (
+            _COLOR_ALPHA * last_stress + _COLOR_BETA * stress,
+            _COLOR_ALPHA * last_warmth + _COLOR_BETA * warmth,
+            _COLOR_ALPHA * last_clarity + _COLOR_BETA * clarity,
+            _COLOR_ALPHA * last_drive + _COLOR_BETA * drive,
+            _COLOR_ALPHA * last_calm + _COLOR_BETA * calm,
+        )
         intensity = smooth(self._last_intensity, intensity, alpha=0.7)
 
         self._last_color = color
         self._last_intensity = intensity
 
         return RMSOutput(
-            memory_color=color,
+            memory_color=dict(zip(COLOR_AXES, color)),
             intensity=intensity,
             trauma_flag=trauma_flag
         )
@@ -112,9 +124,9 @@ class RMSEngineV6:
     # Core Logic
     # -------------------------------------------------------------------------
 
-    def _generate_color(self, eva: Dict[str, float]) -> Dict[str, float]:
+    def _generate_color(self, eva: Dict[str, float]) -> Tuple[float, float, float, float, float]:
         """
-        Project EVA_Matrix → memory color axes
+        Project EVA_Matrix → memory color axes (COLOR_AXES order)
         """
 
         stress = clamp(
@@ -141,13 +153,7 @@ class RMSEngineV6:
             eva.get("emotional_tension", 0.0)
         )
 
-        return {
-            "stress": stress,
-            "warmth": warmth,
-            "clarity": clarity,
-            "drive": drive,
-            "calm": calm,
-        }
+        return stress, warmth, clarity, drive, calm
 
     # -------------------------------------------------------------------------
 
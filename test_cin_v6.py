@@ -56,5 +56,33 @@ def test_cin_v6():
         print("\n[FAILED] Injection Blocked")
         print(result.get("reason"))
 
+def test_cin_audit_log_writer():
+    import tempfile
+    import threading
+    from Orchestrator.CIN.cin_audit_engine import CINAuditEngine
+
+    print("--- Running CIN Audit Log Writer Test ---")
+
+    base_path = tempfile.mkdtemp()
+    engines = [CINAuditEngine(base_path, None) for _ in range(3)]
+
+    paths = set()
+    for i in range(300):
+        report = {"turn": i, "status": "pass", "note": "ภาษาไทย"}
+        paths.add(engines[i % 3].write_log(i, report))
+    engines[0].flush_logs()
+
+    # All engines share one writer thread and one daily NDJSON file
+    writers = [t for t in threading.enumerate() if t.name == "cin-audit-log"]
+    assert len(writers) == 1, f"expected one writer thread, got {len(writers)}"
+    assert len(paths) == 1 and next(iter(paths)).endswith(".ndjson")
+
+    with open(next(iter(paths)), "r", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert sorted(r["turn"] for r in lines) == list(range(300))
+    assert all(r["note"] == "ภาษาไทย" for r in lines)
+    print("Audit log writer: PASS")
+
 if __name__ == "__main__":
     test_cin_v6()
+    test_cin_audit_log_writer()
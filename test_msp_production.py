@@ -85,6 +85,13 @@ def test_msp_production_flow():
         assert len(master_data["episodes"]) == 1
         print("[PASS] Master episodic memory updated")
 
+    # 6. Verify sensory master migrated to header + entries log
+    sensory_dir = base_path / "03_Sensory_memory"
+    assert not (sensory_dir / "Sensory_memory.json").exists()
+    assert (sensory_dir / "Sensory_memory.header.json").exists()
+    assert msp.load_sensory_master()["entries"] == []
+    print("[PASS] Sensory master split into header + NDJSON entries")
+
     print("\n[ALL PRODUCTION MSP TESTS PASSED]")
 
 if __name__ == "__main__":
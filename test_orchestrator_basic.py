@@ -5,6 +5,8 @@ This test verifies the orchestrator structure without actual LLM calls
 """
 
 import sys
+import json
+import types
 from pathlib import Path
 
 # Add paths
@@ -12,6 +14,59 @@ sys.path.append(str(Path(__file__).parent / "Orchestrator"))
 
 from eva_tool import EVATool
 
+
+class StubLLMBridge:
+    """LLMBridge stand-in: records every call and answers without an API key"""
+
+    def __init__(self, model_name=None):
+        self.client_ready = True
+        self.calls = []
+
+    def generate(self, prompt, system_instruction=None):
+        self.calls.append((prompt, system_instruction))
+        if "Cognitive Scan" in (system_instruction or ""):
+            if "sad" in prompt.lower():
+                return json.dumps({
+                    "intent": "share_feeling",
+                    "stimulus_vector": {"stress": 0.6, "sadness": 0.7},
+                    "emotion_detected": "sadness",
+                    "call_eva_tool": True,
+                    "reasoning": "emotional disclosure"
+                })
+            return json.dumps({
+                "intent": "greeting",
+                "stimulus_vector": {"neutral": 0.5},
+                "emotion_detected": "neutral",
+                "call_eva_tool": False,
+                "reasoning": "small talk"
+            })
+        return "stub reply"
+
+    def generate_stream(self, prompt, system_instruction=None):
+        # Same text as generate(), one word per chunk
+        words = self.generate(prompt, system_instruction).split(" ")
+        for i, word in enumerate(words):
+            yield word if i == len(words) - 1 else word + " "
+
+
+def _orchestrator_with_stub_llm(**kwargs):
+    """Build a TwoPhaseOrchestrator whose LLM bridge is a StubLLMBridge"""
+    try:
+        import llm_bridge
+    except ImportError:
+        # Gemini client not installed: the real bridge is never called here
+        llm_bridge = types.ModuleType("llm_bridge")
+        llm_bridge.LLMBridge = StubLLMBridge
+        sys.modules["llm_bridge"] = llm_bridge
+
+    import two_phase_orchestrator
+    real_bridge = two_phase_orchestrator.LLMBridge
+    two_phase_orchestrator.LLMBridge = StubLLMBridge
+    try:
+        return two_phase_orchestrator, two_phase_orchestrator.TwoPhaseOrchestrator(enable_msp=False, **kwargs)
+    finally:
+        two_phase_orchestrator.LLMBridge = real_bridge
+
 def test_eva_tool_integration():
     """Test EVA Tool integration"""
     print("="*80)
@@ -89,6 +144,84 @@ def test_eva_tool_integration():
     print("="*80)
 
 
+def test_process_batch_matches_process():
+    """process_batch gives the same results as one process() call per tick"""
+    print("\n" + "="*80)
+    print("EVA TOOL BATCH EQUIVALENCE TEST")
+    print("="*80)
+
+    stimuli = [
+        {"stress": 0.9, "anxiety": 0.8, "threat": 0.7},
+        {"warmth": 0.9, "bonding": 0.8},
+        {"neutral": 0.5},
+        {"novelty": 0.7, "curiosity": 0.6},
+    ]
+    stamp = "2025-01-01T00:00:00.000Z"
+
+    single_tool = EVATool(enable_msp=False)
+    single_tool.start_session("batch_equivalence", "test_001")
+    singles = [single_tool.process(stimulus_vector=s, timestamp=stamp) for s in stimuli]
+
+    batch_tool = EVATool(enable_msp=False)
+    batch_tool.start_session("batch_equivalence", "test_001")
+    batch = batch_tool.process_batch(stimuli, timestamp=stamp)
+
+    def pulse_values(snapshot):
+        # pulse_id and the snapshot timestamp come from the wall clock
+        return {k: snapshot[k] for k in ("pulse_mode", "arousal_level", "valence_level", "cognitive_mode",
+                                         "pacing", "llm_prompt_flags", "safety_actions", "debug_tags")}
+
+    assert len(batch) == len(stimuli)
+    for i, (one, many) in enumerate(zip(singles, batch)):
+        for name in ("emotion_state", "reflex_directives", "qualia_snapshot",
+                     "memory_encoding", "timestamp"):
+            assert getattr(one, name) == getattr(many, name), f"tick {i}: {name} differs"
+        assert pulse_values(one.pulse_snapshot) == pulse_values(many.pulse_snapshot), f"tick {i}: pulse differs"
+        print(f"  [PASS] tick {i}: {one.pulse_snapshot['pulse_mode']}")
+
+    single_tool.end_session()
+    batch_tool.end_session()
+    return True
+
+
+def test_baseline_cache():
+    """Neutral ticks reuse a fresh-state baseline, handed out as private copies"""
+    print("\n" + "="*80)
+    print("EVA TOOL BASELINE CACHE TEST")
+    print("="*80)
+
+    keys = ("pulse_mode", "arousal_level", "valence_level", "cognitive_mode",
+            "pacing", "llm_prompt_flags", "safety_actions", "debug_tags")
+
+    # Reference: an empty stimulus on a fresh pipeline
+    fresh_tool = EVATool(enable_msp=False)
+    fresh_tool.start_session("baseline_reference", "test_001")
+    fresh = fresh_tool.process(stimulus_vector={})
+
+    tool = EVATool(enable_msp=False, allow_baseline_cache=True)
+    tool.start_session("baseline_cache", "test_001")
+    # The stress tick leaves residual hormones; the baseline must not see them
+    results = tool.process_batch([{"stress": 0.9, "threat": 0.8}, {}, {"neutral": 0.05}])
+
+    for result in results[1:]:
+        assert result.emotion_state == fresh.emotion_state
+        assert result.reflex_directives == fresh.reflex_directives
+        assert {k: result.pulse_snapshot[k] for k in keys} == {k: fresh.pulse_snapshot[k] for k in keys}
+        assert result.ess_id == tool.ess_id
+    print("  [PASS] neutral ticks match an empty stimulus on fresh state")
+
+    results[1].pulse_snapshot.pacing["edited"] = True
+    results[1].emotion_state["edited"] = 1.0
+    again = tool.process(stimulus_vector={})
+    assert "edited" not in again.pulse_snapshot.pacing
+    assert "edited" not in again.emotion_state
+    print("  [PASS] reused results do not share mutable state")
+
+    fresh_tool.end_session()
+    tool.end_session()
+    return True
+
+
 def test_orchestrator_structure():
     """Test orchestrator can be imported and initialized"""
     print("\n" + "="*80)
@@ -125,10 +258,111 @@ def test_orchestrator_structure():
     return True
 
 
+def test_phase1_cache_and_speculation():
+    """Phase 1 cache hits skip the LLM; no-tool Phase 2 is speculated only on misses"""
+    print("\n" + "="*80)
+    print("PHASE 1 CACHE / SPECULATION TEST")
+    print("="*80)
+
+    tpo, orch = _orchestrator_with_stub_llm()
+    orch.start_session("stub_session")
+    llm = orch.llm
+
+    def count(instruction):
+        # Let a pending speculative call land before counting
+        orch._speculation_pool.submit(lambda: None).result()
+        return sum(1 for _, system in llm.calls if system == instruction)
+
+    # Miss, no tool: Phase 1 plus the speculative no-tool Phase 2
+    r1 = orch.process("Hello")
+    assert r1.final_response == "stub reply" and r1.eva_tool_result is None
+    assert count(tpo.PHASE1_SYSTEM_INSTRUCTION) == 1
+    assert count(tpo.PHASE2_SIMPLE_SYSTEM_INSTRUCTION) == 1
+    print("[OK] Miss: Phase 1 called, no-tool reply speculated")
+
+    # Hit after normalization: no Phase 1 call, one direct no-tool Phase 2
+    r1.phase1_output.stimulus_vector["neutral"] = 99.0
+    r2 = orch.process("  hELLO ")
+    assert count(tpo.PHASE1_SYSTEM_INSTRUCTION) == 1
+    assert count(tpo.PHASE2_SIMPLE_SYSTEM_INSTRUCTION) == 2
+    assert r2.phase1_output.intent == "greeting"
+    assert r2.phase1_output.stimulus_vector == {"neutral": 0.5}, "cached entry must not be shared"
+    print("[OK] Hit: Phase 1 skipped, cached output copied per turn")
+
+    # Miss that calls the tool, then a hit that calls the tool
+    r3 = orch.process("I feel sad")
+    assert r3.eva_tool_result is not None
+    simple_calls = count(tpo.PHASE2_SIMPLE_SYSTEM_INSTRUCTION)
+    r4 = orch.process("i feel sad")
+    assert r4.eva_tool_result is not None
+    assert count(tpo.PHASE1_SYSTEM_INSTRUCTION) == 2
+    assert count(tpo.PHASE2_SIMPLE_SYSTEM_INSTRUCTION) == simple_calls, "no speculation on a tool hit"
+    print("[OK] Tool hit: no speculative no-tool call")
+
+    # bypass_cache always asks the LLM
+    orch.process("Hello", bypass_cache=True)
+    assert count(tpo.PHASE1_SYSTEM_INSTRUCTION) == 3
+    print("[OK] bypass_cache re-runs Phase 1")
+
+    orch.eva_tool.end_session()
+    return True
+
+
+def test_process_stream():
+    """process_stream yields the Phase 2 text and returns the same result as process()"""
+    print("\n" + "="*80)
+    print("PROCESS STREAM TEST")
+    print("="*80)
+
+    def run_stream(orch, text, **kwargs):
+        chunks = []
+        stream = orch.process_stream(text, **kwargs)
+        while True:
+            try:
+                chunks.append(next(stream))
+            except StopIteration as stop:
+                return chunks, stop.value
+
+    _, orch = _orchestrator_with_stub_llm()
+    orch.start_session("stub_stream")
+
+    # Tool turn: Phase 2 streamed chunk by chunk
+    chunks, tool_result = run_stream(orch, "I feel sad")
+    assert len(chunks) == 2 and "".join(chunks) == "stub reply"
+    assert tool_result.final_response == "stub reply"
+    assert tool_result.eva_tool_result is not None
+    assert tool_result.phase1_output.call_eva_tool
+    print(f"  [PASS] tool turn streamed {len(chunks)} chunks")
+
+    # No-tool miss: the speculative response is yielded whole
+    chunks, result = run_stream(orch, "Hello")
+    assert chunks == ["stub reply"] and result.eva_tool_result is None
+    print("  [PASS] speculative no-tool response yielded whole")
+
+    # No-tool hit: nothing speculated, the simple reply is streamed
+    chunks, result = run_stream(orch, "hello")
+    assert len(chunks) == 2 and result.final_response == "stub reply"
+    print("  [PASS] cached no-tool turn streamed")
+
+    # Same turn through process(): same response and Phase 1 output
+    plain = orch.process("I feel sad")
+    assert plain.final_response == tool_result.final_response
+    assert plain.phase1_output == tool_result.phase1_output
+    assert plain.eva_tool_result is not None
+    print("  [PASS] process() agrees with process_stream()")
+
+    orch.eva_tool.end_session()
+    return True
+
+
 if __name__ == "__main__":
     # Run tests
     test_eva_tool_integration()
+    test_process_batch_matches_process()
+    test_baseline_cache()
     test_orchestrator_structure()
+    test_phase1_cache_and_speculation()
+    test_process_stream()
 
     print("\n" + "="*80)
     print("BASIC ORCHESTRATOR TESTS COMPLETE")
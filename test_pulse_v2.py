@@ -51,5 +51,98 @@ def test_pulse_logic():
 
     print("\n[ALL TESTS PASSED]")
 
+def test_pulse_drift_batch():
+    from compute_pulse_drift import compute_pulse_drift, compute_pulse_drift_batch
+
+    # Band edges (500 / 1500 / 4000 ms), negative and NaN intervals
+    now = [0.0, 0.4999, 0.5, 1.2, 1.5, 1.5001, 4.0, 4.0001, 9.0, -1.0, float("nan")]
+    prev = [0.0] * len(now)
+
+    batch = compute_pulse_drift_batch(prev, now)
+    for i, (p, n) in enumerate(zip(prev, now)):
+        scalar = compute_pulse_drift(p, n)
+        for key, value in scalar.items():
+            assert batch[key][i] == value, f"pair {i}: {key} {batch[key][i]!r} != {value!r}"
+    print(f"Pulse drift batch: {len(now)} pairs match compute_pulse_drift")
+
+def test_pulse_sot_log():
+    import json
+    import os
+    import tempfile
+    from pulse_engine import SOT_SCHEMA_VERSION, convert_json_to_jsonl
+
+    engine = PulseEngineV2()
+    log_dir = tempfile.mkdtemp()
+    log_path = os.path.join(log_dir, "sot.jsonl")
+
+    c_mod = {"OX": 0.8, "5HT": 0.6, "EN": 0.5, "AD": 0.1, "NA": 0.1, "CT": 0.1}
+    ri_data = {"RI_L3": 0.8, "RI_L5": {"O5_intimacy": 0.8, "O3_empathic_resonance": 0.7}}
+    first = engine.compute_pulse(c_mod, ri_data, {"safety_level": "LOW"}, {})
+    second = engine.compute_pulse(c_mod, ri_data, {"safety_level": "CRITICAL"}, {})
+    engine.save_to_sot(first, log_path)
+    engine.save_to_sot(second, log_path)
+
+    # Header once, then one appended line per snapshot
+    with open(log_path, "r", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0] == {"schema_version": SOT_SCHEMA_VERSION}
+    assert [line["pulse_mode"] for line in lines[1:]] == ["DEEP_CARE", "EMERGENCY_HOLD"]
+
+    # Whole-document logs are refused rather than appended to
+    try:
+        engine.save_to_sot(first, os.path.join(log_dir, "legacy.json"))
+        assert False, "save_to_sot accepted a .json path"
+    except ValueError:
+        pass
+
+    # Legacy document -> header line + one line per data_log entry
+    legacy_path = os.path.join(log_dir, "legacy.json")
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        json.dump({"schema_version": "sot-0.9", "session": "s1",
+                   "data_log": [{"pulse_mode": "CALM"}, {"pulse_mode": "ALERT"}]}, f)
+    out_path = convert_json_to_jsonl(legacy_path)
+    assert out_path == os.path.join(log_dir, "legacy.jsonl")
+    with open(out_path, "r", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert lines == [{"schema_version": "sot-0.9", "session": "s1"},
+                     {"pulse_mode": "CALM"}, {"pulse_mode": "ALERT"}]
+    print("SOT log: JSONL append and legacy conversion OK")
+
+def test_pulse_vectors():
+    import random
+    from pulse_engine import compute_pulse_vectors
+
+    rng = random.Random(7)
+    keys = ["AD", "NA", "CT", "5HT", "OX", "EN"]
+    c_mods, ri_data, eva_ri_inputs = [], [], []
+    for i in range(200):
+        c_mods.append({k: rng.random() for k in keys})
+        ri_data.append({
+            "RI_L1": rng.random(), "RI_L2": rng.random(), "RI_L4": rng.random(),
+            "RI_L5": {"S9_existential_clarity": rng.random(), "O5_intimacy": rng.random(),
+                      "O3_empathic_resonance": rng.random()},
+            "RZ_state": {"RZ_active": i % 5 == 0},
+        })
+        eva_ri_inputs.append({"existential_signal": rng.random()})
+
+    vectors = compute_pulse_vectors(c_mods, ri_data, eva_ri_inputs)
+    engine = PulseEngineV2()
+    for i in range(len(c_mods)):
+        snapshot = engine.compute_pulse(c_mods[i], ri_data[i], {"safety_level": "LOW"}, {}, eva_ri_inputs[i])
+        # The snapshot carries the levels rounded to 4 places
+        assert round(float(vectors["arousal"][i]), 4) == snapshot.arousal_level, f"turn {i}: arousal"
+        assert round(float(vectors["valence"][i]), 4) == snapshot.valence_level, f"turn {i}: valence"
+
+    # A short list must not silently drop turns
+    try:
+        compute_pulse_vectors(c_mods, ri_data[:-1], eva_ri_inputs)
+        assert False, "compute_pulse_vectors accepted lists of different lengths"
+    except ValueError:
+        pass
+    print(f"Pulse vectors: {len(c_mods)} turns match compute_pulse")
+
 if __name__ == "__main__":
     test_pulse_logic()
+    test_pulse_drift_batch()
+    test_pulse_sot_log()
+    test_pulse_vectors()
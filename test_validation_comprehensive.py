@@ -283,6 +283,184 @@ def test_clarification_loop_protection():
     return True
 
 
+# =============================================================================
+# Test ValidationResult Pool
+# =============================================================================
+
+def test_validation_result_pool():
+    """Test that released results are recycled and come back empty"""
+    print("\n" + "="*80)
+    print("TEST: ValidationResult Pool")
+    print("="*80)
+
+    from validation import acquire_result, release_result
+
+    result = acquire_result()
+    result.add_error("boom")
+    result.add_warning("careful")
+    result.context["key"] = "value"
+    release_result(result)
+
+    recycled = acquire_result()
+    assert recycled is result
+    assert recycled.valid
+    assert not recycled.errors and not recycled.warnings and not recycled.context
+    print("  [PASS] Released result recycled in clean state")
+
+    return True
+
+
+# =============================================================================
+# Test Compiled Episodic Checks
+# =============================================================================
+
+def test_compiled_episodic_checks():
+    """Test the generated episodic section checks against expected errors"""
+    print("\n" + "="*80)
+    print("TEST: Compiled Episodic Section Checks")
+    print("="*80)
+
+    from validation import EpisodicValidator, ValidationResult
+    from validation.episodic_validator import _compile_section_checks
+
+    checks = _compile_section_checks(EpisodicValidator)
+
+    def run(name, node):
+        result = ValidationResult(valid=True)
+        checks[name](node, result)
+        return result.errors
+
+    matrix = {"stress_load": 0.2, "social_warmth": 0.5, "drive_level": 0.6, "cognitive_clarity": 0.9}
+
+    cases = [
+        # Valid input
+        ("check_episode_header", {"episode_type": "interaction"}, []),
+        ("check_situation_context", {
+            "interaction_mode": "casual", "stakes_level": "low", "time_pressure": "high"
+        }, []),
+        ("validate_eva_matrix", matrix, []),
+        ("validate_qualia", {"intensity": 0.5}, []),
+        ("validate_reflex", {"threat_level": 0.0}, []),
+        # Invalid enum values (including unhashable ones)
+        ("check_episode_header", {"episode_type": "dream"}, [
+            "Invalid enum value for 'episode_header.episode_type': 'dream' "
+            "not in ['interaction', 'observation', 'system_event']"
+        ]),
+        ("check_episode_header", {"episode_type": {"x": 1}}, [
+            "Invalid enum value for 'episode_header.episode_type': '{'x': 1}' "
+            "not in ['interaction', 'observation', 'system_event']"
+        ]),
+        ("check_situation_context", {"stakes_level": ["low"]}, [
+            "Invalid enum value for 'situation_context.stakes_level': '['low']' "
+            "not in ['high', 'low', 'medium']"
+        ]),
+        # Wrong types and out-of-range values
+        ("validate_eva_matrix", dict(matrix, drive_level="high"), [
+            "Field 'eva_matrix.drive_level' must be numeric, got str"
+        ]),
+        ("validate_qualia", {"intensity": 1.5}, [
+            "Field 'qualia.intensity' value 1.5 out of range [0.0, 1.0]"
+        ]),
+        ("validate_reflex", [0.1], ["reflex must be an object"]),
+        # Missing and extra fields
+        ("check_episode_header", {}, []),
+        ("validate_eva_matrix", {k: v for k, v in matrix.items() if k != "drive_level"}, [
+            "eva_matrix missing required axis: 'drive_level'"
+        ]),
+        ("validate_qualia", {}, ["qualia missing 'intensity'"]),
+        ("validate_reflex", {"threat_level": 0.1, "panic": 1}, [
+            "reflex contains extra fields: {'panic'}"
+        ]),
+    ]
+
+    for name, node, expected in cases:
+        errors = run(name, node)
+        assert errors == expected, f"{name}({node!r}): {errors!r} != {expected!r}"
+    print(f"  [PASS] {len(cases)} compiled check cases match expected errors")
+
+    return True
+
+
+# =============================================================================
+# Test Episodic Turn Enum Checks
+# =============================================================================
+
+def test_episodic_turn_enum_checks():
+    """Test that malformed turn enum values are reported, not raised"""
+    print("\n" + "="*80)
+    print("TEST: Episodic Turn Enum Checks")
+    print("="*80)
+
+    from validation import EpisodicValidator
+
+    validator = EpisodicValidator()
+    episode = {
+        "episode_header": {"episode_type": "interaction"},
+        "situation_context": {"context_id": "ctx_001", "interaction_mode": "casual"},
+        "turns": [
+            {"turn_id": "t1", "speaker": {"name": "user"}, "raw_text": "hi"},
+            {"turn_id": "t2", "speaker": "eva", "raw_text": "hello",
+             "affective_inference": {"epistemic_status": []}},
+        ],
+    }
+
+    result = validator.validate(episode)
+    assert not result.valid
+    assert "Invalid enum value for 'turns[0].speaker': '{'name': 'user'}' not in ['eva', 'user']" in result.errors
+    assert (
+        "Invalid enum value for 'turns[1].affective_inference.epistemic_status': '[]' "
+        "not in ['hypothesize', 'speculate']"
+    ) in result.errors
+    print("  [PASS] Dict speaker and list epistemic_status reported as enum errors")
+
+    return True
+
+
+# =============================================================================
+# Test Semantic Validation Phases
+# =============================================================================
+
+def test_semantic_validation_phases():
+    """Test phase selection and the consolidation gate's safety checks"""
+    print("\n" + "="*80)
+    print("TEST: Semantic Validation Phases")
+    print("="*80)
+
+    from validation import SemanticValidator
+
+    validator = SemanticValidator()
+    entry = {
+        "concept": "likes_tea",
+        "definition": "User likes tea",
+        "epistemic_status": "confirmed",
+        "confidence": 0.8,
+        "derived_from": {"episode_id": "ep_001"}
+    }
+    forbidden = dict(entry, user_block={"note": "likes tea"})
+    bad_concept = dict(entry, concept="User Likes Tea!")
+
+    # Consolidation still runs concept format and forbidden-field checks
+    assert validator.validate_for_consolidation(entry)
+    assert not validator.validate_for_consolidation(forbidden)
+    assert not validator.validate_for_consolidation(bad_concept)
+    print("  [PASS] Consolidation rejects forbidden fields and bad concepts")
+
+    # phases={1, 3} skips conflict detection (phase 4)
+    existing = [dict(entry, definition="User dislikes tea")]
+    conflict = "Conflict detected with existing concept: 'likes_tea'"
+    assert conflict in validator.validate(entry, existing).warnings
+    assert conflict not in validator.validate(entry, existing, phases=frozenset({1, 3})).warnings
+    print("  [PASS] phases={1, 3} skips conflict detection")
+
+    # The default run reports every phase's errors
+    result = validator.validate(dict(bad_concept, user_block={"note": "likes tea"}))
+    assert "Concept 'User Likes Tea!' must be lowercase_snake_case format" in result.errors
+    assert "Forbidden field found: 'user_block'" in result.errors
+    print("  [PASS] Default run reports concept-format and forbidden-field errors")
+
+    return True
+
+
 # =============================================================================
 # Run All Tests
 # =============================================================================
@@ -297,6 +475,10 @@ if __name__ == "__main__":
     results.append(("Semantic Consolidation Threshold", test_semantic_consolidation_threshold()))
     results.append(("Sensory No-Interpretation", test_sensory_no_interpretation()))
     results.append(("Clarification Loop Protection", test_clarification_loop_protection()))
+    results.append(("ValidationResult Pool", test_validation_result_pool()))
+    results.append(("Compiled Episodic Checks", test_compiled_episodic_checks()))
+    results.append(("Episodic Turn Enum Checks", test_episodic_turn_enum_checks()))
+    results.append(("Semantic Validation Phases", test_semantic_validation_phases()))
 
     print("\n" + "="*80)
     print("TEST RESULTS SUMMARY")